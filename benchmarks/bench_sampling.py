@@ -0,0 +1,270 @@
+"""
+bench_sampling.py
+Замер скорости всех способов генерации выборок в проекте (значений в секунду).
+
+Примеры:
+    python benchmarks/bench_sampling.py --sizes 1e3 1e5 1e6 --out bench.json
+    python benchmarks/bench_sampling.py --group lab1 --compare bench.json
+    python benchmarks/bench_sampling.py --list
+    python benchmarks/bench_sampling.py --group lab2-support --supports 1e2 1e5 1e7
+
+Результаты сохраняются в JSON; с --compare для каждого случая печатается
+изменение скорости относительно прошлого запуска.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+# Каталоги лабораторных не являются пакетами — модули подключаются по путям
+for lab in ("lab1", "lab2", "lab5"):
+    sys.path.insert(0, str(ROOT / lab))
+
+import engine                     # noqa: E402  (lab1)
+import distributions              # noqa: E402,F401
+import discrete                   # noqa: E402  (lab2)
+from rejection import estimate_bound, rejection_sample   # noqa: E402
+from tabulated import tabulate    # noqa: E402
+from fenwick import FenwickSampler  # noqa: E402  (lab2)
+import normal_engines             # noqa: E402  (lab5)
+
+
+# ---- Реестр случаев ----
+CASES = []
+
+
+def case(group, name, max_n=None, sizes=None):
+    """Регистрирует функцию fn(n, rng), генерирующую n значений.
+
+    max_n ограничивает размер для медленных циклов на чистом Python;
+    sizes — собственные размеры случая вместо общих --sizes.
+    """
+    def wrap(fn):
+        CASES.append({"group": group, "name": name, "fn": fn, "max_n": max_n, "sizes": sizes})
+        return fn
+    return wrap
+
+
+# ---- lab1: метод обратной функции, табличная F^-1, метод исключения ----
+def _register_lab1():
+    for dist_name, dist in engine.DISTRIBUTIONS.items():
+        case("lab1", f"inverse/{dist_name}")(
+            lambda n, rng, d=dist: d.inverse(rng.random(n)))
+
+        table = tabulate(dist.support, dist.F, None, 1e-10)
+        case("lab1", f"tabulated/{dist_name}")(
+            lambda n, rng, t=table: t(rng.random(n)))
+
+        f_max = estimate_bound(dist.f, dist.support)
+        case("lab1", f"rejection/{dist_name}")(
+            lambda n, rng, d=dist, fm=f_max: rejection_sample(d.f, d.support, fm, n, rng)[0])
+
+        for strategy in ("stratified", "sobol"):
+            case("lab1", f"{strategy}/{dist_name}")(
+                lambda n, rng, d=dist, s=strategy: d.inverse(engine.uniforms(n, rng, s)))
+
+
+_register_lab1()
+
+
+# ---- lab2: дискретная СВ по ключам ----
+LAB2_X = [-7, 1, 2]
+LAB2_P = [0.7, 0.1, 0.2]
+LAB2_CUMULATIVE = discrete.build_cumulative(LAB2_P)
+
+
+@case("lab2", "simulate_once loop", max_n=10**6)
+def _lab2_loop(n, rng):
+    random.seed(int(rng.integers(2**32)))
+    return discrete.simulate_samples_with_counts(LAB2_X, LAB2_CUMULATIVE, n)
+
+
+@case("lab2", "searchsorted")
+def _lab2_searchsorted(n, rng):
+    keys = np.asarray(LAB2_CUMULATIVE)
+    idx = np.minimum(np.searchsorted(keys, rng.random(n), side="right"), len(keys) - 1)
+    return np.asarray(LAB2_X)[idx], np.bincount(idx, minlength=len(keys))
+
+
+LAB2_ALIAS = discrete.AliasTable(LAB2_CUMULATIVE)
+
+
+@case("lab2", "alias")
+def _lab2_alias(n, rng):
+    idx = LAB2_ALIAS.sample_indices(n, rng)
+    return np.asarray(LAB2_X)[idx], np.bincount(idx, minlength=len(LAB2_X))
+
+
+# ---- lab2: выбор способа по размеру носителя ----
+GUIDE_FACTORS = (0.25, 2, 8)
+
+
+def register_support_cases(supports):
+    """Перебор ключей и все векторные способы для носителей из K значений.
+
+    Случаи *-build замеряют построение таблицы (n = K), остальные — выбор номеров;
+    guide-m{f}K — индексная таблица с f·K ячейками вместо K.
+    """
+    for K in supports:
+        p = np.random.default_rng(K).random(K)
+        keys = np.cumsum(p / p.sum())
+        x = np.arange(K, dtype=float)
+        case("lab2-support", f"loop/K={K}", max_n=max(1, 10**7 // K))(
+            lambda n, rng, k=keys.tolist(), v=x.tolist():
+                discrete.simulate_samples_with_counts(v, k, n, "loop"))
+        for engine in discrete.SAMPLERS:
+            case("lab2-support", f"{engine}-build/K={K}", sizes=[K])(
+                lambda n, rng, e=engine, k=keys: discrete.make_sampler(e, k))
+            sampler = discrete.make_sampler(engine, keys)
+            case("lab2-support", f"{engine}/K={K}")(
+                lambda n, rng, s=sampler: s(n, rng))
+        # Размер индексной таблицы Чена: m = factor·K ячеек (guide/K выше — m = K)
+        for factor in GUIDE_FACTORS:
+            case("lab2-support", f"guide-m{factor:g}K-build/K={K}", sizes=[K])(
+                lambda n, rng, f=factor, k=keys: discrete.make_sampler("guide", k, guide_factor=f))
+            sampler = discrete.make_sampler("guide", keys, guide_factor=factor)
+            case("lab2-support", f"guide-m{factor:g}K/K={K}")(
+                lambda n, rng, s=sampler: s(n, rng))
+        # Изменение отдельных вероятностей (n точечных обновлений) без перестройки
+        tree = FenwickSampler(p)
+        case("lab2-support", f"fenwick-update/K={K}", max_n=10**5)(
+            lambda n, rng, t=tree: t.update_many(rng.integers(0, len(t), n), rng.random(n)))
+
+
+# ---- lab3–lab6: модуль random в списковых включениях и замены на NumPy ----
+@case("lab3", "random.uniform list", max_n=10**6)
+def _uniform_list(n, rng):
+    return [random.uniform(2.0, 5.0) for _ in range(n)]
+
+
+@case("lab3", "Generator.uniform")
+def _uniform_numpy(n, rng):
+    return rng.uniform(2.0, 5.0, n)
+
+
+@case("lab4", "random.expovariate list", max_n=10**6)
+def _expo_list(n, rng):
+    return [random.expovariate(1.0) for _ in range(n)]
+
+
+@case("lab4", "Generator.exponential")
+def _expo_numpy(n, rng):
+    return rng.exponential(1.0, n)
+
+
+@case("lab5", "random.normalvariate list", max_n=10**6)
+def _normal_list(n, rng):
+    return [random.normalvariate(0.0, 1.0) for _ in range(n)]
+
+
+@case("lab5", "Generator.normal")
+def _normal_numpy(n, rng):
+    return rng.normal(0.0, 1.0, n)
+
+
+# Способы генерации N(0, 1) из lab5 (normalvariate уже замерен выше)
+for _name, _engine in normal_engines.ENGINES.items():
+    if _name != "normalvariate":
+        case("lab5", f"normal/{_name}")(lambda n, rng, e=_engine: e(rng, n))
+
+
+# ---- Запуск ----
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_case(c, n, repeat, seed):
+    # Лучшее время из repeat запусков — меньше всего зависит от фоновой нагрузки
+    best = float("inf")
+    for k in range(repeat):
+        rng = np.random.default_rng([seed, k])
+        start = time.perf_counter()
+        c["fn"](n, rng)
+        best = min(best, time.perf_counter() - start)
+    return {"group": c["group"], "case": c["name"], "n": n,
+            "seconds": best, "samples_per_sec": n / best if best > 0 else float("inf")}
+
+
+def compare(results, baseline_path):
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    old = {(r["case"], r["n"]): r["samples_per_sec"] for r in baseline["results"]}
+    print(f"\n---- Сравнение с {baseline_path} ({baseline['meta'].get('revision')}) ----")
+    for r in results:
+        before = old.get((r["case"], r["n"]))
+        if before:
+            change = (r["samples_per_sec"] / before - 1) * 100
+            print(f"{r['case']:<32} N={r['n']:<10} {before:>12.4g} → "
+                  f"{r['samples_per_sec']:>12.4g} знач./с  ({change:+.1f}%)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Скорость генерации выборок")
+    parser.add_argument("--sizes", nargs="+", default=["1e3", "1e5", "1e6"],
+                        help="размеры выборок")
+    parser.add_argument("--group", nargs="+", default=None,
+                        help="только указанные группы (lab1, lab2, ...)")
+    parser.add_argument("--match", default=None, help="только случаи, содержащие подстроку")
+    parser.add_argument("--repeat", type=int, default=3, help="число повторов замера")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results.json", help="файл JSON с результатами")
+    parser.add_argument("--compare", default=None, help="JSON прошлого запуска для сравнения")
+    parser.add_argument("--supports", nargs="+", default=["1e2", "1e4", "1e6"],
+                        help="размеры носителя для группы lab2-support")
+    parser.add_argument("--list", action="store_true", help="показать случаи и выйти")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.group is None or "lab2-support" in args.group:
+        register_support_cases([int(float(K)) for K in args.supports])
+    cases = [c for c in CASES
+             if (args.group is None or c["group"] in args.group)
+             and (args.match is None or args.match in c["name"])]
+    if args.list:
+        for c in cases:
+            print(f"{c['group']:<6} {c['name']}")
+        return
+
+    sizes = [int(float(s)) for s in args.sizes]
+    results = []
+    for c in cases:
+        for n in c["sizes"] or sizes:
+            if c["max_n"] is not None and n > c["max_n"]:
+                continue
+            r = run_case(c, n, args.repeat, args.seed)
+            results.append(r)
+            print(f"{r['group']:<6} {r['case']:<32} N={n:<10} "
+                  f"{r['seconds']:>10.4f} с  {r['samples_per_sec']:>12.4g} знач./с")
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+    }
+    Path(args.out).write_text(json.dumps({"meta": meta, "results": results}, indent=1),
+                              encoding="utf-8")
+    print("\nСохранено:", args.out)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+sample_cache.py
+LRU-кэш выборок и посчитанных по ним величин для приложений Streamlit
+(lab3–lab5). При каждом действии пользователя Streamlit заново выполняет
+весь скрипт; если параметры распределения, N и seed не изменились, выборка,
+m, Dx и таблица берутся из кэша.
+
+Размер кэша ограничен в байтах (массивы NumPy и растущие выборки SampleStore
+считаются по nbytes, строки — по длине): при переполнении удаляются давно не
+использованные записи. Запись, которая выросла после сохранения, пересчитывается
+методом resize().
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+DEFAULT_MAX_BYTES = 512 * 2**20
+
+
+def entry_size(value):
+    """Примерный объём значения в байтах (массивы, строки, вложенные dict/list/tuple)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "nbytes"):   # SampleStore и другие объекты с буфером
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(entry_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(entry_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _freeze(value):
+    # Закэшированные массивы видят все сессии — запрещаем их изменение
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _freeze(v)
+
+
+class SampleCache:
+    """Кэш «ключ → результат» с вытеснением давно не использованных записей.
+
+    Один объект обслуживает все сессии приложения (сессии Streamlit работают
+    в разных потоках), поэтому доступ защищён блокировкой.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # ключ -> (значение, размер)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, compute):
+        """Значение по ключу; при промахе вызывается compute() и результат сохраняется."""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            self.misses += 1
+        value = compute()   # вне блокировки: другие сессии не ждут долгой генерации
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        _freeze(value)
+        size = entry_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return  # больше всего кэша — не сохраняем
+            self._entries[key] = (value, size)
+            self.bytes += size
+            self._evict()
+
+    def resize(self, key):
+        """Пересчитать объём записи key (например, после роста SampleStore)."""
+        with self._lock:
+            if key not in self._entries:
+                return
+            value, old = self._entries.pop(key)
+            self.bytes -= old
+            size = entry_size(value)
+            if size > self.max_bytes:
+                return  # как в put(): запись больше всего кэша убирается одна
+            # Запись становится самой свежей, так что вытесняются только другие
+            self._entries[key] = (value, size)
+            self.bytes += size
+            self._evict()
+
+    def _evict(self):
+        # Вызывается под блокировкой; первыми уходят давно не использованные записи
+        while self.bytes > self.max_bytes:
+            _, (_, old) = self._entries.popitem(last=False)
+            self.bytes -= old
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                "bytes": self.bytes, "max_bytes": self.max_bytes}
@@ -0,0 +1,82 @@
+"""
+sample_store.py
+Выборка, которая растёт блоками и не меняет уже сгенерированное начало.
+
+Блок k всегда генерируется из np.random.default_rng([seed, k]), поэтому
+первые N значений одинаковы при любом порядке запросов: при увеличении N
+генерируются только недостающие блоки, при уменьшении — берётся срез.
+Для каждого блока хранятся суммы (x - shift) и (x - shift)², так что m и Dx
+для любого N считаются по накопленным суммам блоков и хвосту последнего
+неполного блока — за время O(размер блока), а не O(N).
+
+Хранилище лежит в общем кэше приложения и может расти из нескольких сессий
+сразу, поэтому рост и чтение сумм защищены блокировкой.
+"""
+
+import threading
+
+import numpy as np
+
+
+DEFAULT_BLOCK = 1 << 16
+
+
+class SampleStore:
+    """generate(rng, n) — n значений распределения из генератора rng."""
+
+    def __init__(self, generate, seed, block_size=DEFAULT_BLOCK):
+        self.generate = generate
+        self.seed = seed
+        self.block_size = block_size
+        self._buf = np.empty(0)
+        self._blocks = 0
+        self._s1 = [0.0]   # накопленные суммы (x - shift) по целым блокам
+        self._s2 = [0.0]   # и (x - shift)²
+        self.shift = None  # первое значение выборки: без потери точности в Dx
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._blocks * self.block_size
+
+    def _grow(self, n):
+        need = -(-n // self.block_size)
+        if need <= self._blocks:
+            return
+        if need * self.block_size > len(self._buf):
+            # Ёмкость с запасом в 2 раза: копирование амортизируется
+            size = max(need, 2 * self._blocks) * self.block_size
+            buf = np.empty(size)
+            buf[:len(self)] = self._buf[:len(self)]
+            self._buf = buf
+        for k in range(self._blocks, need):
+            block = self.generate(np.random.default_rng([self.seed, k]), self.block_size)
+            if self.shift is None:
+                self.shift = float(block[0])
+            d = block - self.shift
+            self._s1.append(self._s1[-1] + d.sum())
+            self._s2.append(self._s2[-1] + np.dot(d, d))
+            self._buf[k * self.block_size:(k + 1) * self.block_size] = block
+        self._blocks = need
+
+    def take(self, n):
+        """Первые n значений (только для чтения)."""
+        with self._lock:
+            self._grow(n)
+            view = self._buf[:n]
+        view.flags.writeable = False
+        return view
+
+    def moments(self, n):
+        """m и Dx первых n значений по суммам блоков."""
+        with self._lock:
+            self._grow(n)
+            full = n // self.block_size
+            tail = self._buf[full * self.block_size:n] - self.shift
+            s1 = self._s1[full] + tail.sum()
+            s2 = self._s2[full] + np.dot(tail, tail)
+        mean_d = s1 / n
+        return self.shift + mean_d, s2 / n - mean_d ** 2
+
+    @property
+    def nbytes(self):
+        return self._buf.nbytes
@@ -0,0 +1,125 @@
+"""
+widgets.py
+Общие элементы интерфейса приложений Streamlit lab3–lab5: seed выборки,
+общий для всех сессий кэш выборок и строка с его статистикой, растущая
+выборка сессии, постраничная таблица значений выборки.
+"""
+
+import numpy as np
+import streamlit as st
+
+from sample_cache import DEFAULT_MAX_BYTES, SampleCache
+from sample_store import SampleStore
+
+
+@st.cache_resource
+def shared_cache(name, max_bytes=DEFAULT_MAX_BYTES):
+    """Один кэш на приложение name в процессе сервера Streamlit."""
+    return SampleCache(max_bytes)
+
+
+def _new_seed():
+    st.session_state.seed = int(np.random.SeedSequence().entropy % 2**32)
+
+
+def seed_controls():
+    """Поле seed и кнопка «Новая выборка»; seed хранится в сессии."""
+    if "seed" not in st.session_state:
+        _new_seed()
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        seed = st.number_input("seed", min_value=0, max_value=2**32 - 1, step=1, key="seed")
+    with col2:
+        st.button("🎲 Новая выборка", on_click=_new_seed)
+    return int(seed)
+
+
+def cache_caption(cache):
+    s = cache.stats()
+    st.caption(f"Кэш выборок: попаданий {s['hits']}, промахов {s['misses']}, "
+               f"записей {s['entries']}, {s['bytes'] / 2**20:.1f} из "
+               f"{s['max_bytes'] / 2**20:.0f} МБ")
+
+
+def session_store(cache, params, seed, generate, n):
+    """Растущая выборка для параметров params и seed, готовая отдать n значений.
+
+    Текущее хранилище закреплено в сессии: при изменении только N
+    догенерируются недостающие блоки, даже если выборка уже не помещается
+    в кэш. Общий кэш (ключ (params, seed)) — вторичный: из него берётся
+    выборка при возврате к прежним параметрам, а объём записи
+    пересчитывается после роста.
+    """
+    key = (params, seed)
+    if st.session_state.get("store_key") != key:
+        st.session_state.store_key = key
+        st.session_state.store = cache.get(key, lambda: SampleStore(generate, seed))
+    store = st.session_state.store
+    if len(store) < n:
+        store.take(n)
+        cache.resize(key)
+    return store
+
+
+def store_caption(store, n):
+    st.caption(f"Выборка сессии: показано {n} из {len(store)} сгенерированных значений "
+               f"({store.nbytes / 2**20:.1f} МБ); при изменении N догенерируется только хвост")
+
+
+# ====== Постраничная таблица значений ======
+TABLE_STYLE = """
+<style>
+table {
+    border-collapse: collapse;
+    width: 100%;
+    font-size: 14px;
+}
+th {
+    background-color: #4C78A8;
+    color: white;
+    padding: 8px;
+    text-align: center;
+    border: 1px solid #ddd;
+}
+td {
+    padding: 8px;
+    border: 1px solid #ddd;
+    text-align: center;
+}
+tr:nth-child(even) {
+    background-color: #f2f2f2;
+}
+</style>
+"""
+
+
+def values_table_html(values, start=0, columns=5):
+    """HTML-таблица values по columns в строке; слева номера значений (с 1)."""
+    html = TABLE_STYLE + "<table><tr><th>№</th>"
+    html += "".join(f"<th>Колонка {j + 1}</th>" for j in range(columns)) + "</tr>"
+    for r in range(0, len(values), columns):
+        cells = [f"{v:.6f}" for v in values[r:r + columns]]
+        cells += [""] * (columns - len(cells))   # неполная последняя строка
+        html += (f"<tr><td>{start + r + 1}</td>"
+                 + "".join(f"<td>{c}</td>" for c in cells) + "</tr>")
+    return html + "</table>"
+
+
+def paged_table(samples, key="page", columns=5, rows_options=(4, 10, 20, 50)):
+    """Таблица одной страницы выборки: форматируется только видимый срез,
+    поэтому время отрисовки и объём HTML не зависят от N."""
+    st.markdown("<h3 style='color:#4C78A8;'>📋 Значения выборки</h3>", unsafe_allow_html=True)
+    n = len(samples)
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        rows = st.selectbox("Строк на странице", rows_options, key=f"{key}_rows")
+    page_size = rows * columns
+    pages = max(1, -(-n // page_size))
+    # После уменьшения N или роста страницы номер может выйти за пределы
+    st.session_state[key] = min(st.session_state.get(key, 1), pages)
+    with col2:
+        page = st.number_input("Страница", min_value=1, max_value=pages, step=1, key=key)
+    start = (int(page) - 1) * page_size
+    values = samples[start:start + page_size]
+    st.markdown(values_table_html(values, start, columns), unsafe_allow_html=True)
+    st.caption(f"Страница {page} из {pages}: значения {start + 1}–{start + len(values)} из {n}")
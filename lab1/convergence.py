@@ -0,0 +1,120 @@
+"""
+convergence.py
+Исследование сходимости: R независимых повторений таблицы для каждого N.
+Повторения распределяются по процессам; у каждого повторения свой поток
+случайных чисел из SeedSequence.spawn, поэтому результат не зависит от
+числа процессов. По ошибкам delta1/delta2 строятся среднее, квантили и
+аппроксимация C / N^p (для метода Монте-Карло ожидается p ≈ 1/2).
+variance_reduction() сравнивает стратегии получения r по дисперсии оценок.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+import engine
+import distributions  # noqa: F401  (распределения регистрируются и в процессах-воркерах)
+
+
+QUANTILES = (0.05, 0.5, 0.95)
+_WARMED = set()  # (name, strategy), уже прогретые в этом процессе
+
+
+def _run_replications(name, N_values, seeds, strategy="plain"):
+    # Воркер: несколько повторений подряд, чтобы не платить за пересылку каждого.
+    # Возвращает ошибки и время самих повторений: первый вызов стратегии в процессе
+    # (импорт scipy.stats.qmc для sobol, прогрев кода) выполняется отдельно и не в счёт
+    if (name, strategy) not in _WARMED:
+        engine.simulate(name, [16], np.random.default_rng(0), strategy)
+        _WARMED.add((name, strategy))
+    start = time.perf_counter()
+    out = np.empty((len(seeds), 2, len(N_values)))
+    for k, seed in enumerate(seeds):
+        results = engine.simulate(name, N_values, np.random.default_rng(seed), strategy)
+        out[k, 0] = results["delta1"]
+        out[k, 1] = results["delta2"]
+    return out, time.perf_counter() - start
+
+
+def _fit_rate(N_values, errors):
+    # log(err) = log(C) - p log(N): свободная аппроксимация и C при p = 1/2
+    C_sqrt = float(np.mean(errors * np.sqrt(N_values)))
+    if len(N_values) < 2:
+        return {"p": np.nan, "C": np.nan, "C_sqrt": C_sqrt}
+    slope, intercept = np.polyfit(np.log(N_values), np.log(errors), 1)
+    return {"p": -slope, "C": np.exp(intercept), "C_sqrt": C_sqrt}
+
+
+def convergence_study(name, N_values, R=100, workers=None, seed=None, batch=None,
+                      strategy="plain", pool=None):
+    """R повторений таблицы для каждого N; возвращает статистику ошибок и наклоны.
+
+    pool — готовый ProcessPoolExecutor (если нужно несколько расчётов подряд);
+    seconds — суммарное время повторений в воркерах, без запуска процессов.
+    """
+    N_values = np.asarray(N_values, dtype=np.int64)
+    workers = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(R)
+    batch = batch or max(1, R // (4 * workers))
+    parts = [seeds[i:i + batch] for i in range(0, R, batch)]
+
+    n = len(parts)
+    if pool is not None:
+        chunks = list(pool.map(_run_replications,
+                               [name] * n, [N_values] * n, parts, [strategy] * n))
+    elif workers == 1:
+        chunks = [_run_replications(name, N_values, part, strategy) for part in parts]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_replications,
+                                   [name] * n, [N_values] * n, parts, [strategy] * n))
+    errors = np.concatenate([c[0] for c in chunks])  # форма (R, 2, len(N_values))
+
+    table = {"N": N_values}
+    fit = {}
+    for j, col in enumerate(("delta1", "delta2")):
+        e = errors[:, j, :]
+        table[f"{col}_mean"] = e.mean(axis=0)
+        for q, values in zip(QUANTILES, np.quantile(e, QUANTILES, axis=0)):
+            table[f"{col}_q{int(q * 100):02d}"] = values
+        fit[col] = _fit_rate(N_values, table[f"{col}_mean"])
+    return {"table": table, "fit": fit, "R": R, "errors": errors,
+            "seconds": sum(c[1] for c in chunks)}
+
+
+def variance_reduction(name, N, R=200, strategies=engine.STRATEGIES, workers=None, seed=None):
+    """Коэффициенты уменьшения дисперсии оценок m и hat_D относительно "plain".
+
+    mse — средний квадрат ошибки по R повторениям; vrf = mse_plain / mse;
+    efficiency учитывает ещё и время: во сколько раз дешевле plain достичь
+    той же точности; N_equiv — объём plain-выборки с такой же ошибкой по m.
+    time_s — время самих повторений в воркерах: запуск процессов, импорты и
+    первый вызов стратегии не учитываются, а все стратегии идут в одном пуле.
+    """
+    rows = {"strategy": [], "mse_m": [], "vrf_m": [], "mse_D": [], "vrf_D": [],
+            "time_s": [], "efficiency": [], "N_equiv": []}
+    base = None
+    # Базой сравнения всегда служит обычная выборка
+    strategies = ["plain"] + [s for s in strategies if s != "plain"]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        studies = [convergence_study(name, [N], R, workers, seed, strategy=strategy, pool=pool)
+                   for strategy in strategies]
+    for strategy, study in zip(strategies, studies):
+        elapsed = study["seconds"]
+        mse = (study["errors"][:, :, 0] ** 2).mean(axis=0)
+        if base is None:
+            base = (mse, elapsed)
+        vrf = base[0] / mse
+        rows["strategy"].append(strategy)
+        rows["mse_m"].append(mse[0])
+        rows["vrf_m"].append(vrf[0])
+        rows["mse_D"].append(mse[1])
+        rows["vrf_D"].append(vrf[1])
+        rows["time_s"].append(elapsed)
+        rows["efficiency"].append(vrf[0] * base[1] / elapsed)
+        rows["N_equiv"].append(int(round(N * vrf[0])))
+    return rows
@@ -0,0 +1,65 @@
+"""
+distributions.py
+Распределения из лабораторной работы 1, зарегистрированные в движке engine.py.
+"""
+
+import numpy as np
+
+from engine import register
+
+
+# ---- f(x) = 3x² на (0, 1] ----
+CUBIC = register(
+    "cubic",
+    f=lambda x: np.where((x > 0) & (x <= 1), 3*x**2, 0),
+    F=lambda x: np.where(x <= 0, 0, np.where(x >= 1, 1, x**3)),
+    inverse=lambda r: r**(1/3),
+    support=(0, 1),
+    Mx=0.75,
+    Dx=0.0375,
+    f_label="f(x) = 3x²",
+    F_label="F(x) = x³",
+    plot_range=(-0.2, 1.2),
+)
+
+# ---- f(x) = 6/(π√(1-x²)) на (1/2, √3/2) ----
+ARCSIN = register(
+    "arcsin",
+    f=lambda x: np.where((x > 0.5) & (x < np.sqrt(3)/2),
+                         6 / (np.pi * np.sqrt(1 - x**2)),
+                         0),
+    F=lambda x: np.where(
+        x <= 0.5, 0,
+        np.where(
+            x >= np.sqrt(3)/2, 1,
+            (6/np.pi) * (np.arcsin(x) - np.pi/6)
+        )
+    ),
+    inverse=lambda r: np.sin((np.pi/6) * (1 + r)),
+    support=(0.5, np.sqrt(3)/2),
+    Mx=(3/np.pi) * (np.sqrt(3) - 1),
+    Dx=0.5 - ((3/np.pi) * (np.sqrt(3) - 1))**2,
+    f_label="f(x) = 6/(π√(1-x²))",
+    F_label="F(x)",
+    plot_range=(0.45, 0.9),
+)
+
+# ---- f(x) = 1/(x ln(5/2)) на (2, 5) ----
+LOG = register(
+    "log",
+    f=lambda x: np.where((x > 2) & (x < 5), 1 / (x * np.log(5/2)), 0),
+    F=lambda x: np.where(
+        x <= 2, 0,
+        np.where(
+            x >= 5, 1,
+            np.log(x/2)/np.log(5/2)
+        )
+    ),
+    inverse=lambda r: 2 * (5/2)**r,
+    support=(2, 5),
+    Mx=3 / np.log(5/2),
+    Dx=21 / (2 * np.log(5/2)) - (3 / np.log(5/2))**2,
+    f_label="f(x) = 1/(x ln(5/2))",
+    F_label="F(x)",
+    plot_range=(1.8, 5.2),
+)
@@ -0,0 +1,236 @@
+"""
+engine.py
+Общий движок моделирования непрерывных случайных величин методом обратной функции.
+Распределение регистрируется один раз (f, F, F^-1, Mx, Dx), после чего
+simulate() считает таблицу для всех N одним векторным вызовом NumPy,
+а simulate_streaming() — по блокам в ограниченной памяти для очень больших N.
+Равномерные числа r можно получать разными стратегиями (см. STRATEGIES):
+так как F^-1 монотонна, антитетические пары, стратификация и квази-случайные
+точки Соболя уменьшают дисперсию оценок m и hat_D.
+"""
+
+import sys
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from moments import mean_and_variance
+from tabulated import tabulate
+
+
+COLUMNS = ["N", "m", "Mx", "delta1", "g", "Dx", "delta2"]
+
+
+@dataclass
+class Distribution:
+    name: str
+    f: object                   # плотность f(x)
+    F: object                   # функция распределения F(x)
+    inverse: object             # обратная функция F^-1(r), явная или табличная
+    support: tuple              # носитель (a, b)
+    Mx: float                   # математическое ожидание
+    Dx: float                   # дисперсия
+    f_label: str = "f(x)"       # подписи для графиков
+    F_label: str = "F(x)"
+    plot_range: tuple = None    # отрезок для графиков f и F
+
+
+# ---- Реестр распределений ----
+DISTRIBUTIONS = {}
+
+
+def _tabulated_inverse(support, F, f, tol):
+    # Таблица строится при первом вызове и дальше берётся из кэша tabulate()
+    return lambda r: tabulate(support, F, f, tol)(r)
+
+
+def register(name, f=None, F=None, inverse=None, support=None, Mx=None, Dx=None,
+             f_label="f(x)", F_label="F(x)", plot_range=None, tol=1e-10):
+    """Регистрирует распределение.
+
+    Если inverse не задана, F^-1 строится численно по F (или по f, если F нет)
+    с точностью tol по вероятности. Если не заданы Mx или Dx, они считаются
+    квадратурой по f (см. moments.py).
+    """
+    if f is None and F is None:
+        raise ValueError("Нужно задать f(x) или F(x)")
+    a, b = support = (float(support[0]), float(support[1]))
+    if inverse is None:
+        inverse = _tabulated_inverse(support, F, f, tol)
+    if F is None:
+        F = lambda x: tabulate(support, None, f, tol).cdf(x)
+    if f is None:
+        f = _density_from_cdf(F, support)
+    if Mx is None or Dx is None:
+        Mx_q, Dx_q = mean_and_variance(f, support)
+        Mx = Mx_q if Mx is None else Mx
+        Dx = Dx_q if Dx is None else Dx
+    if plot_range is None:
+        pad = 0.1 * (b - a)
+        plot_range = (a - pad, b + pad)
+    dist = Distribution(name, f, F, inverse, support, float(Mx), float(Dx),
+                        f_label, F_label, tuple(plot_range))
+    DISTRIBUTIONS[name] = dist
+    return dist
+
+
+def _density_from_cdf(F, support):
+    # Центральная разность для графика плотности, когда задана только F
+    h = 1e-6 * (support[1] - support[0])
+    return lambda x: (np.asarray(F(x + h)) - np.asarray(F(x - h))) / (2 * h)
+
+
+def with_tabulated_inverse(dist, tol=1e-10, source="F"):
+    """Копия распределения, моделируемая по табличной F^-1 (source: "F" или "f")."""
+    if isinstance(dist, str):
+        dist = get(dist)
+    F, f = (dist.F, None) if source == "F" else (None, dist.f)
+    return replace(dist, name=f"{dist.name}[tab:{source}]",
+                   inverse=_tabulated_inverse(dist.support, F, f, tol))
+
+
+def with_numeric_moments(dist):
+    """Копия распределения, у которой Mx и Dx посчитаны квадратурой по f."""
+    if isinstance(dist, str):
+        dist = get(dist)
+    Mx, Dx = mean_and_variance(dist.f, dist.support)
+    return replace(dist, Mx=Mx, Dx=Dx)
+
+
+def get(name):
+    try:
+        return DISTRIBUTIONS[name]
+    except KeyError:
+        raise KeyError(f"Распределение '{name}' не зарегистрировано. "
+                       f"Доступны: {', '.join(DISTRIBUTIONS)}") from None
+
+
+# ---- Стратегии получения равномерных чисел ----
+STRATEGIES = ("plain", "antithetic", "stratified", "sobol")
+
+
+def uniforms(n, rng, strategy="plain"):
+    """n равномерных на [0, 1) чисел выбранной стратегией."""
+    if strategy == "plain":
+        return rng.random(n)
+    if strategy == "antithetic":
+        # Пары (r, 1 - r): F^-1 монотонна, поэтому значения отрицательно коррелированы
+        half = rng.random((n + 1) // 2)
+        return np.concatenate((half, 1 - half))[:n]
+    if strategy == "stratified":
+        # По одной точке в каждом из n равных интервалов
+        return (np.arange(n) + rng.random(n)) / n
+    if strategy == "sobol":
+        from scipy.stats import qmc
+
+        m = max(0, int(np.ceil(np.log2(n))))
+        points = qmc.Sobol(d=1, scramble=True, seed=rng).random_base2(m)
+        return points[:n, 0]
+    raise ValueError(f"Неизвестная стратегия '{strategy}'. Доступны: {', '.join(STRATEGIES)}")
+
+
+# ---- Моделирование методом обратной функции ----
+def _segment_moments(x, N_values):
+    # Суммы x и x² по отрезкам, соответствующим каждому N
+    offsets = np.concatenate(([0], np.cumsum(N_values)[:-1]))
+    s1 = np.add.reduceat(x, offsets)
+    s2 = np.add.reduceat(x * x, offsets)
+    return s1, s2
+
+
+def _table(dist, N_values, m, g, hat_D):
+    return {
+        "N": N_values,
+        "m": m,
+        "Mx": np.full(len(N_values), dist.Mx),
+        "delta1": np.abs(dist.Mx - m),
+        "g": g,
+        "Dx": np.full(len(N_values), dist.Dx),
+        "delta2": np.abs(dist.Dx - hat_D),
+        "hat_D": hat_D,
+    }
+
+
+def simulate(dist, N_values, rng=None, strategy="plain"):
+    """Одна выборка на каждое N; все выборки генерируются одним массивом."""
+    if isinstance(dist, str):
+        dist = get(dist)
+    rng = np.random.default_rng() if rng is None else rng
+    N_values = np.asarray(N_values, dtype=np.int64)
+    if np.any(N_values <= 0):
+        raise ValueError("N должно быть положительным числом")
+
+    if strategy == "plain":
+        r = rng.random(int(N_values.sum()))
+    else:
+        # Стратификация и QMC строятся отдельно для каждой выборки
+        r = np.concatenate([uniforms(int(N), rng, strategy) for N in N_values])
+    return table_from_sample(dist, N_values, dist.inverse(r))
+
+
+def table_from_sample(dist, N_values, x):
+    """Таблица по готовой выборке x, разбитой на отрезки длиной N_values."""
+    N_values = np.asarray(N_values, dtype=np.int64)
+    s1, s2 = _segment_moments(x, N_values)
+    m = s1 / N_values
+    g = s2 / N_values
+    hat_D = g - m ** 2  # выборочная дисперсия
+    return _table(dist, N_values, m, g, hat_D)
+
+
+# ---- Потоковое моделирование для очень больших N ----
+DEFAULT_CHUNK = 1 << 22
+
+
+def _stream_moments(dist, N, chunk_size, rng, strategy="plain"):
+    # Среднее и сумма квадратов отклонений M2 по блокам; блоки сливаются
+    # по формулам Чана (обобщение Уэлфорда), поэтому в памяти только один блок
+    n, mean, M2 = 0, 0.0, 0.0
+    r = np.empty(min(N, chunk_size))
+    while n < N:
+        size = min(chunk_size, N - n)
+        if strategy == "plain":
+            block = r[:size]
+            rng.random(out=block)
+        else:
+            block = uniforms(size, rng, strategy)
+        x = dist.inverse(block)
+        mean_b = x.mean()
+        x -= mean_b
+        M2_b = np.dot(x, x)
+
+        total = n + size
+        delta = mean_b - mean
+        mean += delta * size / total
+        M2 += M2_b + delta * delta * n * size / total
+        n = total
+    return mean, M2
+
+
+def simulate_streaming(dist, N_values, chunk_size=DEFAULT_CHUNK, rng=None, strategy="plain"):
+    """Та же таблица, что и у simulate(), но память O(chunk_size) при любом N."""
+    if isinstance(dist, str):
+        dist = get(dist)
+    rng = np.random.default_rng() if rng is None else rng
+    N_values = np.array([int(N) for N in N_values], dtype=np.int64)
+    if np.any(N_values <= 0):
+        raise ValueError("N должно быть положительным числом")
+
+    m = np.empty(len(N_values))
+    hat_D = np.empty(len(N_values))
+    for k, N in enumerate(N_values):
+        mean, M2 = _stream_moments(dist, int(N), chunk_size, rng, strategy)
+        m[k] = mean
+        hat_D[k] = M2 / N
+    return _table(dist, N_values, m, hat_D + m ** 2, hat_D)
+
+
+def peak_rss_mb():
+    """Пиковый объём резидентной памяти процесса в МБ (None, если недоступно)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux возвращает килобайты, macOS — байты
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
@@ -1,80 +1,26 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+import report
+from engine import simulate, with_numeric_moments
+from distributions import ARCSIN
 
-# ---- Плотность и функция распределения ----
-def f(x):
-    return np.where((x > 0.5) & (x < np.sqrt(3)/2),
-                    6 / (np.pi * np.sqrt(1 - x**2)),
-                    0)
+# Mx и Dx не из ручных выкладок, а квадратурой по плотности f
+dist = with_numeric_moments(ARCSIN)
 
-def F(x):
-    return np.where(
-        x <= 0.5, 0,
-        np.where(
-            x >= np.sqrt(3)/2, 1,
-            (6/np.pi) * (np.arcsin(x) - np.pi/6)
-        )
-    )
-
-# ---- Моделирование методом обратной функции ----
-def simulate(N):
-    r = np.random.rand(N)
-    x = np.sin((np.pi/6) * (1 + r))  # обратная функция F^-1(r)
-    
-    m = np.mean(x)                    # выборочное среднее
-    g = np.mean(x**2)                 # средний квадрат
-    hat_D = g - m**2                  # выборочная дисперсия
-    
-    # теперь Mx и Dx "аналитические" считаются по той же выборке
-    Mx = m
-    Dx = hat_D
-    
-    delta1 = 0  # поскольку Mx берём по выборке, дельта = 0
-    delta2 = 0  # аналогично
-    
-    return m, delta1, g, hat_D, delta2
-
-# ---- Создаем таблицу ----
 N_values = [10, 100, 1000, 10000]
-rows = []
-for N in N_values:
-    m, d1, g, hat_D, d2 = simulate(N)
-    rows.append([N, m, g, hat_D])
 
-df = pd.DataFrame(rows, columns=["N", "m", "g", "hat_D"])
-print(df)
 
-# ---- Рисуем графики f(x) и F(x) ----
-x_vals = np.linspace(0.45, 0.9, 400)
-plt.figure(figsize=(12,5))
+def main():
+    # ---- Теоретические значения (квадратура по f) ----
+    print("Mx =", dist.Mx)
+    print("Dx =", dist.Dx)
 
-plt.subplot(1,2,1)
-plt.plot(x_vals, f(x_vals), label="f(x) = 6/(π√(1-x²))", color="blue")
-plt.title("Плотность f(x)")
-plt.grid(True)
-plt.legend()
+    # ---- Моделирование методом обратной функции (все N одним вызовом) ----
+    results = simulate(dist, N_values)
+    print(report.format_table(results))
 
-plt.subplot(1,2,2)
-plt.plot(x_vals, F(x_vals), label="F(x)", color="red")
-plt.title("Функция распределения F(x)")
-plt.grid(True)
-plt.legend()
+    # ---- Графики f(x), F(x) и таблица (matplotlib загружается только здесь) ----
+    report.show(dist, results, "Результаты моделирования (Mx и Dx по квадратуре f)",
+                table_size=(12, 2.5))
 
-plt.tight_layout()
-plt.show()
 
-# ---- Рисуем таблицу отдельным окном ----
-fig, ax = plt.subplots(figsize=(12, 2.5))
-ax.axis("off")
-table = ax.table(
-    cellText=df.round(6).values,
-    colLabels=df.columns,
-    loc="center",
-    cellLoc="center"
-)
-table.auto_set_font_size(False)
-table.set_fontsize(10)
-table.scale(1.2, 1.5)
-ax.set_title("Результаты моделирования (Mx и Dx по выборке)", fontweight="bold")
-plt.show()
+if __name__ == '__main__':
+    main()
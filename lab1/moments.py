@@ -0,0 +1,111 @@
+"""
+moments.py
+Теоретические моменты E[X^k] по плотности f(x) — адаптивной квадратурой
+(scipy.integrate.quad) по носителю, без ручных выкладок.
+Результаты запоминаются в памяти и на диске; ключ — носитель и значения f
+в контрольных точках, так что при изменении плотности моменты пересчитываются.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+CACHE_PATH = Path(os.environ.get(
+    "LAB1_MOMENTS_CACHE",
+    Path.home() / ".cache" / "modeling-labs" / "moments.json",
+))
+
+_memory = {}
+
+
+def _key(f, support):
+    # Отпечаток определения распределения: носитель + f в 64 точках внутри него
+    a, b = support
+    probe = a + (b - a) * (np.arange(64) + 0.5) / 64
+    values = np.asarray(f(probe), dtype=np.float64)
+    h = hashlib.sha256()
+    h.update(np.asarray(support, dtype=np.float64).tobytes())
+    h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def _load_disk():
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+@contextmanager
+def _locked():
+    # Межпроцессная блокировка файла кэша на время чтения-изменения-записи
+    if fcntl is None:
+        yield  # без fcntl (Windows) одна из одновременных записей может потеряться
+        return
+    with open(CACHE_PATH.with_name(CACHE_PATH.name + ".lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _save_disk(key, values):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _locked():
+            data = _load_disk()
+            data[key] = values
+            # Своё временное имя и атомарная замена: читатели видят целый файл
+            with tempfile.NamedTemporaryFile("w", dir=CACHE_PATH.parent,
+                                             prefix=CACHE_PATH.name + ".", suffix=".tmp",
+                                             delete=False) as fh:
+                fh.write(json.dumps(data, indent=1))
+            try:
+                os.replace(fh.name, CACHE_PATH)
+            except OSError:
+                os.unlink(fh.name)
+                raise
+    except OSError:
+        pass  # без кэша на диске всё равно работаем
+
+
+def _integrate(f, support, k_max):
+    from scipy.integrate import quad
+
+    a, b = support
+    values = []
+    for k in range(k_max + 1):
+        integral, _ = quad(lambda t: t**k * float(f(t)), a, b,
+                           epsabs=0.0, epsrel=1e-12, limit=200)
+        values.append(integral)
+    # Делим на ∫f, чтобы допускались и ненормированные плотности
+    return [v / values[0] for v in values]
+
+
+def moments(f, support, k_max=4):
+    """[1, E[X], E[X²], ..., E[X^k_max]] для плотности f на носителе support."""
+    support = (float(support[0]), float(support[1]))
+    key = _key(f, support)
+    values = _memory.get(key)
+    if values is None or len(values) <= k_max:
+        values = _load_disk().get(key)
+        if values is None or len(values) <= k_max:
+            values = _integrate(f, support, k_max)
+            _save_disk(key, values)
+        _memory[key] = values
+    return values[:k_max + 1]
+
+
+def mean_and_variance(f, support):
+    """Mx и Dx по плотности."""
+    _, m1, m2 = moments(f, support, k_max=2)
+    return m1, m2 - m1**2
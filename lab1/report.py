@@ -0,0 +1,107 @@
+"""
+report.py
+Вывод результатов лабораторной 1: текстовая таблица, CSV и графики f(x), F(x).
+matplotlib импортируется только при построении графиков. В пакетном режиме
+фигуры создаются как matplotlib.figure.Figure без pyplot: они не попадают
+в глобальный список окон и освобождаются сразу после сохранения.
+"""
+
+import csv
+from pathlib import Path
+
+import numpy as np
+
+from engine import COLUMNS
+
+
+def _format_cell(column, value, float_format):
+    if isinstance(value, str):
+        return value
+    if column == "N" or isinstance(value, (int, np.integer)):
+        return str(int(value))
+    return float_format.format(value)
+
+
+def format_table(results, columns=COLUMNS, float_format="{:.6f}"):
+    """Таблица результатов в виде текста (без pandas)."""
+    cells = [[_format_cell(c, v, float_format) for v in results[c]] for c in columns]
+    widths = [max(len(c), *(len(v) for v in col)) for c, col in zip(columns, cells)]
+    lines = ["  ".join(c.rjust(w) for c, w in zip(columns, widths))]
+    for row in zip(*cells):
+        lines.append("  ".join(v.rjust(w) for v, w in zip(row, widths)))
+    return "\n".join(lines)
+
+
+def write_table(results, path, columns=COLUMNS):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(columns)
+        for row in zip(*(results[c] for c in columns)):
+            writer.writerow([int(v) if c == "N" else repr(float(v)) for c, v in zip(columns, row)])
+
+
+# ---- Графики ----
+def draw_density(fig, dist):
+    x = np.linspace(*dist.plot_range, 400)
+
+    ax1 = fig.add_subplot(1, 2, 1)
+    ax1.plot(x, dist.f(x), label=dist.f_label, color="blue")
+    ax1.set_title("Плотность f(x)")
+    ax1.grid(True)
+    ax1.legend()
+
+    ax2 = fig.add_subplot(1, 2, 2)
+    ax2.plot(x, dist.F(x), label=dist.F_label, color="red")
+    ax2.set_title("Функция распределения F(x)")
+    ax2.grid(True)
+    ax2.legend()
+
+    fig.tight_layout()
+
+
+def draw_table(fig, results, title="Результаты моделирования", columns=COLUMNS):
+    ax = fig.add_subplot(1, 1, 1)
+    ax.axis("off")
+    cells = np.column_stack([np.round(np.asarray(results[c], dtype=float), 6) for c in columns])
+    table = ax.table(
+        cellText=cells,
+        colLabels=columns,
+        loc="center",
+        cellLoc="center"
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1.2, 1.5)
+    ax.set_title(title, fontweight="bold")
+
+
+def show(dist, results, title="Результаты моделирования", table_size=(12, 3)):
+    """Интерактивный режим: два окна, как в исходных скриптах."""
+    import matplotlib.pyplot as plt
+
+    draw_density(plt.figure(figsize=(12, 5)), dist)
+    plt.show()
+
+    draw_table(plt.figure(figsize=table_size), results, title)
+    plt.show()
+
+
+def save(dist, results, out_dir, fmt="png", plots=True, title="Результаты моделирования"):
+    """Пакетный режим: таблица в CSV и (по желанию) графики в файлы."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = [out_dir / f"{dist.name}_table.csv"]
+    write_table(results, paths[0])
+    if plots:
+        from matplotlib.figure import Figure
+
+        for suffix, size, draw in (
+            ("density", (12, 5), lambda fig: draw_density(fig, dist)),
+            ("table", (12, 3), lambda fig: draw_table(fig, results, title)),
+        ):
+            fig = Figure(figsize=size)
+            draw(fig)
+            path = out_dir / f"{dist.name}_{suffix}.{fmt}"
+            fig.savefig(path)
+            paths.append(path)
+    return paths
@@ -0,0 +1,123 @@
+"""
+run.py
+Запуск моделирования из командной строки для зарегистрированных распределений.
+
+Примеры:
+    python run.py cubic log --N 10 100 1000 10000
+    python run.py arcsin --N 1e9 1e11 --stream --chunk 4194304
+    python run.py log --replications 1000 --workers 8 --seed 1
+    python run.py cubic --N 1000 --strategy sobol
+    python run.py cubic --N 1000 --replications 500 --compare-strategies
+    python run.py --out reports --plots       # без окон: CSV и PNG в каталог reports
+    python run.py cubic --N 1e6 --method rejection
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import engine
+import report
+import distributions  # noqa: F401  (регистрирует распределения лабораторной 1)
+from convergence import convergence_study, variance_reduction
+from rejection import simulate_rejection
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Моделирование методом обратной функции")
+    parser.add_argument("names", nargs="*", help="распределения (по умолчанию все)")
+    parser.add_argument("--N", nargs="+", default=["10", "100", "1000", "10000"],
+                        help="объёмы выборок, допускается запись вида 1e9")
+    parser.add_argument("--seed", type=int, default=None, help="seed генератора")
+    parser.add_argument("--stream", action="store_true",
+                        help="потоковый режим: память не зависит от N")
+    parser.add_argument("--chunk", type=int, default=engine.DEFAULT_CHUNK,
+                        help="размер блока в потоковом режиме")
+    parser.add_argument("--method", choices=("inverse", "rejection"), default="inverse",
+                        help="метод моделирования: обратной функции или исключения")
+    parser.add_argument("--strategy", choices=engine.STRATEGIES, default="plain",
+                        help="стратегия получения равномерных чисел")
+    parser.add_argument("--compare-strategies", action="store_true",
+                        help="таблица уменьшения дисперсии для каждой стратегии и N")
+    parser.add_argument("--replications", type=int, default=0,
+                        help="число повторений на каждое N (исследование сходимости)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="число процессов (по умолчанию — все ядра)")
+    parser.add_argument("--out", default=None,
+                        help="каталог для таблиц CSV (пакетный режим, без окон)")
+    parser.add_argument("--plots", action="store_true",
+                        help="вместе с --out сохранять графики f(x), F(x) и таблицу")
+    parser.add_argument("--format", default="png", help="формат графиков (png, svg, pdf)")
+    args = parser.parse_args(argv)
+    if args.plots and not args.out:
+        parser.error("--plots требует --out")
+    return args
+
+
+def print_table(name, results):
+    print(f"\n---- {name} ----")
+    print(report.format_table(results))
+
+
+def print_convergence(name, study):
+    print(f"\n---- {name}: {study['R']} повторений ----")
+    print(report.format_table(study["table"], list(study["table"])))
+    for col, fit in study["fit"].items():
+        print(f"{col} ≈ {fit['C']:.4g} / N^{fit['p']:.3f}   "
+              f"(при p = 1/2: C = {fit['C_sqrt']:.4g})")
+
+
+def print_variance_reduction(name, N, rows):
+    print(f"\n---- {name}: уменьшение дисперсии, N = {N} ----")
+    print(report.format_table(rows, list(rows), float_format="{:.4g}"))
+
+
+def print_rejection_stats(stats):
+    print(f"Метод исключения: f_max = {stats['f_max']:.4g}, "
+          f"доля принятых = {stats['acceptance_rate']:.4f}, "
+          f"предложено = {stats['proposed']}, впустую = {stats['wasted']}, "
+          f"блоков = {stats['blocks']}, {stats['samples_per_sec']:.3g} знач./с")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = args.names or list(engine.DISTRIBUTIONS)
+    N_values = [int(float(N)) for N in args.N]
+    rng = np.random.default_rng(args.seed)
+
+    for name in names:
+        start = time.perf_counter()
+        if args.compare_strategies:
+            for N in N_values:
+                rows = variance_reduction(name, N, args.replications or 200,
+                                          workers=args.workers, seed=args.seed)
+                print_variance_reduction(name, N, rows)
+            print(f"Время: {time.perf_counter() - start:.3f} с")
+            continue
+        if args.replications:
+            study = convergence_study(name, N_values, args.replications,
+                                      args.workers, args.seed, strategy=args.strategy)
+            print_convergence(name, study)
+            print(f"Время: {time.perf_counter() - start:.3f} с")
+            continue
+        if args.method == "rejection":
+            results, stats = simulate_rejection(name, N_values, rng)
+            print_rejection_stats(stats)
+        elif args.stream:
+            results = engine.simulate_streaming(name, N_values, args.chunk, rng, args.strategy)
+        else:
+            results = engine.simulate(name, N_values, rng, args.strategy)
+        print_table(name, results)
+        if args.out:
+            for path in report.save(engine.get(name), results, args.out, args.format, args.plots):
+                print("Сохранено:", path)
+        print(f"Время: {time.perf_counter() - start:.3f} с")
+
+    peak = engine.peak_rss_mb()
+    if peak is not None:
+        print(f"\nПиковая память (RSS): {peak:.1f} МБ")
+
+
+if __name__ == '__main__':
+    main()
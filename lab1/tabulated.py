@@ -0,0 +1,177 @@
+"""
+tabulated.py
+Численная обратная функция распределения для плотностей без явной формулы F^-1.
+По f(x) или F(x) на носителе [a, b] строится таблица узлов (x_k, u_k = F(x_k)),
+между узлами x(u) восстанавливается кубическим полиномом Эрмита с наклонами
+dx/du = 1/f(x_k), ограниченными так, чтобы интерполянт оставался монотонным.
+Узлы добавляются адаптивно, пока ошибка |F(x(u)) - u| не станет меньше tol.
+Моделирование сводится к поиску отрезка (индексная таблица по u, а для
+неоднозначных ячеек — np.searchsorted) и вычислению полинома по схеме Горнера.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+# Узлы и веса Гаусса–Лежандра для интегрирования плотности по отрезку
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(8)
+
+
+def _integrate(f, left, right):
+    # ∫ f(t) dt на каждом отрезке [left_i, right_i] (векторно по всем отрезкам)
+    half = (right - left) / 2
+    mid = (right + left) / 2
+    t = mid[:, None] + half[:, None] * _GL_NODES[None, :]
+    return half * (f(t) * _GL_WEIGHTS).sum(axis=1)
+
+
+def _hermite_coefficients(u, x, dens):
+    # Коэффициенты x(u0 + t*hu) = c0 + c1 t + c2 t² + c3 t³ на каждом отрезке
+    hu = np.diff(u)
+    dx = np.diff(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = 1.0 / dens
+        m0 = hu * slope[:-1]
+        m1 = hu * slope[1:]
+    # Где плотность равна нулю или не задана — берём секущую
+    m0 = np.where(np.isfinite(m0), m0, dx)
+    m1 = np.where(np.isfinite(m1), m1, dx)
+    # Условие монотонности Фрица–Карлсона: α² + β² <= 9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm = np.hypot(m0, m1) / dx
+    scale = np.where(norm > 3, 3 / norm, 1.0)
+    m0, m1 = m0 * scale, m1 * scale
+    return np.column_stack((x[:-1], m0, 3*dx - 2*m0 - m1, m0 + m1 - 2*dx))
+
+
+class TabulatedInverse:
+    """Табличная F^-1 с монотонной интерполяцией и оценкой ошибки по u."""
+
+    def __init__(self, support, F=None, f=None, tol=1e-10, n_start=32, max_knots=1 << 16,
+                 guide_factor=16):
+        if F is None and f is None:
+            raise ValueError("Нужно задать f(x) или F(x)")
+        self.support = (float(support[0]), float(support[1]))
+        self.tol = tol
+        self.guide_factor = guide_factor
+        self._F = F
+        self._f = f
+        self._total = 1.0
+
+        x = np.linspace(*self.support, n_start + 1)
+        if F is None:
+            # Нормируем интеграл плотности, чтобы F(b) = 1
+            self._total = _integrate(f, x[:-1], x[1:]).sum()
+        u = self._cdf_on_grid(x)
+
+        while True:
+            self._set_knots(x, u)
+            err = self._errors(x, u)
+            bad = err > tol
+            if not bad.any() or len(x) >= max_knots:
+                break
+            # Делим пополам отрезки, на которых ошибка больше допустимой
+            idx = np.flatnonzero(bad)
+            x_new = (x[idx] + x[idx + 1]) / 2
+            u_new = self._cdf_from_knots(x_new, x, u)
+            x = np.insert(x, idx + 1, x_new)
+            u = np.insert(u, idx + 1, u_new)
+
+        self.error_bound = float(err.max())
+
+    # ---- Вычисление f(x) и F(x) ----
+    def _density(self, x):
+        if self._f is not None:
+            return np.asarray(self._f(x), dtype=float)
+        # Только F: центральная разность, у границ носителя — односторонняя
+        a, b = self.support
+        h = 1e-6 * (b - a)
+        left, right = np.maximum(x - h, a), np.minimum(x + h, b)
+        return (np.asarray(self._F(right)) - np.asarray(self._F(left))) / (right - left)
+
+    def _cdf_on_grid(self, x):
+        if self._F is not None:
+            u = np.asarray(self._F(x), dtype=float)
+        else:
+            u = np.concatenate(([0.0], np.cumsum(_integrate(self._f, x[:-1], x[1:])))) / self._total
+        return np.clip(u, 0.0, 1.0)
+
+    def _cdf_from_knots(self, x_new, x, u):
+        # F в новых точках: либо напрямую, либо интегралом от ближайшего левого узла
+        if self._F is not None:
+            return np.clip(np.asarray(self._F(x_new), dtype=float), 0.0, 1.0)
+        i = np.clip(np.searchsorted(x, x_new, side="right") - 1, 0, len(x) - 2)
+        return np.clip(u[i] + _integrate(self._f, x[i], x_new) / self._total, 0.0, 1.0)
+
+    # ---- Таблица и интерполяция ----
+    def _set_knots(self, x, u):
+        # Узлы с одинаковым u (нулевая плотность) не дают информации о F^-1
+        keep = np.concatenate(([True], np.diff(u) > 0))
+        self.x, self.u = x[keep], u[keep]
+        self._inv_hu = 1.0 / np.diff(self.u)
+        coef = _hermite_coefficients(self.u, self.x, self._density(self.x))
+        self._coef = [np.ascontiguousarray(c) for c in coef.T]
+        # Индексная таблица: ячейка j ↔ u из [j/G, (j+1)/G); lo и hi — отрезки её концов
+        n = len(self._inv_hu)
+        G = self.guide_factor * n
+        edges = np.arange(G + 1) / G
+        bounds = np.clip(np.searchsorted(self.u, edges, side="right") - 1, 0, n - 1)
+        self._guide_lo, self._guide_hi = bounds[:-1], bounds[1:]
+
+    def _errors(self, x, u):
+        # Ошибка |F(x(u)) - u| в точках 1/4, 1/2, 3/4 каждого отрезка таблицы
+        err = np.zeros(len(x) - 1)
+        for t in (0.25, 0.5, 0.75):
+            u_t = u[:-1] + t * np.diff(u)
+            F_t = self._cdf_from_knots(self(u_t), x, u)
+            err = np.maximum(err, np.abs(F_t - u_t))
+        return err
+
+    def index(self, r):
+        """Номер отрезка таблицы для каждого r из [0, 1] (форма как у r)."""
+        r = np.asarray(r, dtype=float)
+        if r.ndim != 1:
+            # Скаляр и многомерный r: поиск по плоскому массиву, форма восстанавливается
+            return self.index(r.ravel()).reshape(r.shape)
+        G = len(self._guide_lo)
+        j = (r * G).astype(np.intp)
+        np.clip(j, 0, G - 1, out=j)
+        i = self._guide_lo[j]
+        # Бинарный поиск нужен только там, где ячейка захватывает несколько отрезков
+        amb = np.flatnonzero(self._guide_hi[j] != i)
+        if amb.size:
+            k = np.searchsorted(self.u, r[amb], side="right") - 1
+            i[amb] = np.clip(k, 0, len(self._inv_hu) - 1)
+        return i
+
+    def __call__(self, r):
+        r = np.asarray(r, dtype=float)
+        if r.ndim != 1:
+            # Для скаляра — скаляр, для многомерного r — массив той же формы
+            return self(r.ravel()).reshape(r.shape)[()]
+        i = self.index(r)
+        c0, c1, c2, c3 = (np.take(c, i) for c in self._coef)
+        t = r - np.take(self.u, i)
+        t *= np.take(self._inv_hu, i)
+        c3 *= t
+        c3 += c2
+        c3 *= t
+        c3 += c1
+        c3 *= t
+        c3 += c0
+        return c3
+
+    def cdf(self, x):
+        """F(x) по таблице (линейная интерполяция, для графиков)."""
+        return np.interp(x, self.x, self.u, left=0.0, right=1.0)
+
+    @property
+    def n_knots(self):
+        return len(self.x)
+
+
+@lru_cache(maxsize=None)
+def tabulate(support, F=None, f=None, tol=1e-10):
+    """Таблица строится один раз для набора (носитель, F, f, tol) и кэшируется."""
+    return TabulatedInverse(support, F=F, f=f, tol=tol)
@@ -0,0 +1,148 @@
+"""
+batch.py
+Пакетный расчёт многих наборов (X, P, N, q) лабораторной 2 по файлу заданий.
+Задания распределяются по процессам; у каждого задания свой поток случайных
+чисел из SeedSequence.spawn, поэтому результат не зависит от числа процессов.
+Все результаты собираются в один файл (CSV или JSON).
+
+Файл заданий — JSON (список объектов или {"jobs": [...]}):
+    [{"name": "a", "x": [-7, 1, 2], "p": [0.7, 0.1, 0.2], "N": 1e6, "q": 18}, ...]
+либо CSV с заголовком name,x,p,N,q, где X и P записаны через пробел:
+    name,x,p,N,q
+    a,-7 1 2,0.7 0.1 0.2,1e6,18
+Вместо x/p в JSON можно указать "xp_file" (см. loader.py).
+
+Пример:
+    python batch.py jobs.json --out results.csv --workers 8 --seed 1
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+import discrete
+
+
+FIELDS = ["name", "N", "q", "Mx", "m", "delta_m", "g", "Dx", "delta_g", "seconds", "counts"]
+
+
+# ---- Файл заданий ----
+def _job(raw, k):
+    job = {"name": str(raw.get("name") or f"job{k + 1}"),
+           "N": int(float(raw["N"])), "q": int(raw.get("q", 18))}
+    if raw.get("xp_file"):
+        job["xp_file"] = str(raw["xp_file"])
+        return job
+    x, p = raw["x"], raw["p"]
+    if isinstance(x, str):
+        x, p = x.split(), p.split()
+    job["x"], job["p"] = [float(v) for v in x], [float(v) for v in p]
+    if len(job["x"]) != len(job["p"]):
+        raise ValueError(f"❌ {job['name']}: количество значений X и вероятностей P должно совпадать")
+    return job
+
+
+def load_jobs(path):
+    path = Path(path)
+    if path.suffix == ".json":
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = raw["jobs"] if isinstance(raw, dict) else raw
+    else:
+        with open(path, newline="", encoding="utf-8") as fh:
+            raw = list(csv.DictReader(fh))
+    return [_job(r, k) for k, r in enumerate(raw)]
+
+
+# ---- Расчёт ----
+def _run_job(job, seed, engine="alias", chunk_size=discrete.DEFAULT_CHUNK,
+             guide_factor=discrete.DEFAULT_GUIDE_FACTOR):
+    # Воркер: одно задание целиком, наружу — только строка итоговой таблицы
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    if "xp_file" in job:
+        import loader
+
+        x, p, cumulative = loader.load_xp(job["xp_file"])
+        res = discrete.run_prepared(x, p, cumulative, job["N"], job["q"], engine, rng, chunk_size,
+                                    guide_factor=guide_factor)
+    else:
+        res = discrete.run(job["x"], job["p"], job["N"], job["q"], engine, rng, chunk_size,
+                           guide_factor=guide_factor)
+    row = {k: res[k] for k in ["N", "q", "Mx", "m", "delta_m", "g", "Dx", "delta_g"]}
+    row.update(name=job["name"], seconds=time.perf_counter() - start,
+               counts=[int(c) for c in res["counts"]])
+    return row
+
+
+def run_jobs(jobs, workers=None, seed=None, engine="alias", chunk_size=discrete.DEFAULT_CHUNK,
+             guide_factor=discrete.DEFAULT_GUIDE_FACTOR):
+    """Строки результатов в порядке заданий."""
+    workers = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+    n = len(jobs)
+    if workers == 1 or n == 1:
+        return [_run_job(job, s, engine, chunk_size, guide_factor) for job, s in zip(jobs, seeds)]
+    with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+        # Крупные порции для мелких заданий, иначе пересылка дороже расчёта
+        return list(pool.map(_run_job, jobs, seeds, [engine] * n, [chunk_size] * n,
+                             [guide_factor] * n, chunksize=max(1, n // (4 * workers))))
+
+
+def write_results(rows, path):
+    path = Path(path)
+    if path.suffix == ".json":
+        path.write_text(json.dumps([{k: r[k] for k in FIELDS} for r in rows],
+                                   ensure_ascii=False, indent=1), encoding="utf-8")
+        return
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(FIELDS)
+        for r in rows:
+            writer.writerow([r[k] for k in FIELDS[:-1]] + [" ".join(map(str, r["counts"]))])
+
+
+# ---- Командная строка ----
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный расчёт лабораторной 2 по файлу заданий")
+    parser.add_argument("jobs", help="файл заданий (.json или .csv)")
+    parser.add_argument("--out", default="results.csv", help="файл результатов (.csv или .json)")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов (по умолчанию все ядра)")
+    parser.add_argument("--seed", type=int, default=None, help="seed для SeedSequence")
+    parser.add_argument("--engine", choices=list(discrete.SAMPLERS), default="alias",
+                        help="способ выбора значения по ключам")
+    parser.add_argument("--guide-factor", type=float, default=discrete.DEFAULT_GUIDE_FACTOR,
+                        help="для --engine guide: ячеек таблицы на одно значение (m = factor·n)")
+    parser.add_argument("--chunk", type=int, default=discrete.DEFAULT_CHUNK,
+                        help="размер блока при потоковой генерации")
+    args = parser.parse_args(argv)
+    if args.guide_factor <= 0:
+        parser.error("--guide-factor должен быть > 0")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        jobs = load_jobs(args.jobs)
+    except (KeyError, ValueError) as exc:
+        raise SystemExit(f"❌ Ошибка в файле заданий: {exc}") from None
+
+    start = time.perf_counter()
+    rows = run_jobs(jobs, args.workers, args.seed, args.engine, args.chunk, args.guide_factor)
+    elapsed = time.perf_counter() - start
+    write_results(rows, args.out)
+
+    total = sum(r["N"] for r in rows)
+    print(f"Заданий: {len(rows)}, значений: {total}, время: {elapsed:.2f} с "
+          f"({len(rows) / elapsed:.1f} заданий/с, {total / elapsed:.3g} знач./с)")
+    print("Сохранено:", args.out)
+
+
+if __name__ == '__main__':
+    main()
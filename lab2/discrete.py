@@ -0,0 +1,361 @@
+"""
+discrete.py
+Моделирование дискретной случайной величины по ключам (кумулятивным вероятностям).
+Функции вынесены из main.py, чтобы их можно было вызывать без ввода с клавиатуры.
+
+Способы выбора номера значения (ENGINES):
+    loop          — исходный перебор ключей в цикле Python для каждого числа;
+    searchsorted  — тот же поиск первого ключа c_i > u, но векторно в NumPy;
+    alias         — метод псевдонимов Уолкера/Воуза: O(1) на значение;
+    guide         — индексная таблица Чена: прыжок к нужному участку ключей
+                    и короткий перебор вперёд (в среднем < 1 + n/m шагов),
+                    m = guide_factor·n ячеек (по умолчанию m = n);
+    fenwick       — дерево Фенвика (fenwick.py): O(log n) на значение, зато
+                    отдельные вероятности меняются без перестройки ключей.
+Все способы дают одно и то же распределение номеров: P(i) = c_i - c_{i-1},
+а остаток 1 - c_n (если сумма ключей меньше 1) достаётся последнему значению.
+
+Векторные способы работают и в потоковом режиме (simulate_counts): выборка
+генерируется блоками, а хранятся только первые q значений и счётчики K —
+по ним m и Dx считаются точно, так что N может достигать 1e10.
+Если нужна заданная точность, а не заданный N, simulate_until генерирует
+партиями и останавливается, когда полуширины доверительных интервалов для m
+и Dx становятся меньше tol.
+"""
+
+import random
+import time
+from statistics import NormalDist
+
+import numpy as np
+
+
+# ---- Нормализация вероятностей и ключи ----
+def normalize(p):
+    if abs(sum(p) - 1.0) > 1e-6:
+        print("⚠️ Сумма вероятностей не равна 1, нормализуем.")
+        p = [pi / sum(p) for pi in p]
+    return p
+
+
+def build_cumulative(p):
+    cumulative = []
+    s = 0
+    for pi in p:
+        s += pi
+        cumulative.append(s)
+    return cumulative
+
+
+# ---- Теоретические Mx и g ----
+def theory(x, p):
+    x = np.asarray(x, dtype=float)
+    Mx = float(np.dot(x, p))
+    g = float(np.dot(x * x, p)) - Mx ** 2
+    return Mx, g
+
+
+# ---- Функции моделирования ----
+def simulate_once(x, cumulative):
+    u = random.random()
+    for i, c in enumerate(cumulative):
+        if u < c:
+            return x[i], u, i
+    return x[-1], u, len(cumulative) - 1
+
+
+def _simulate_loop(x, cumulative, n_samples, rng=None):
+    counts = [0] * len(x)  # Количество попаданий для каждого диапазона
+    samples = []
+    for _ in range(n_samples):
+        value, u, idx = simulate_once(x, cumulative)
+        samples.append(value)
+        counts[idx] += 1
+    return samples, counts
+
+
+# ---- Векторные способы ----
+def probabilities_from_cumulative(cumulative):
+    """Вероятности номеров, которые фактически даёт поиск по ключам."""
+    c = np.clip(np.asarray(cumulative, dtype=float), 0.0, 1.0)
+    c[-1] = 1.0  # u, не меньшее всех ключей, даёт последнее значение
+    return np.diff(c, prepend=0.0)
+
+
+def sample_indices_searchsorted(cumulative, size, rng):
+    # Первый ключ, строго больший u, — как условие u < c в simulate_once
+    keys = np.asarray(cumulative, dtype=float)
+    idx = np.searchsorted(keys, rng.random(size), side="right")
+    return np.minimum(idx, len(keys) - 1)
+
+
+class AliasTable:
+    """Таблица псевдонимов Воуза: строится за O(n log n) векторно, выбор номера за O(1).
+
+    Построение — «развёртка» (sweep) Вальтера–Воуза без стеков: лёгкие столбцы
+    (n·q < 1) по порядку добирают недостачу у текущего тяжёлого, а тяжёлый,
+    отдав всё сверх 1, сам становится столбцом с псевдонимом на следующий
+    тяжёлый. Если выложить недостачи лёгких и избытки тяжёлых подряд на одной
+    оси (накопленные суммы D и E), псевдоним лёгкого — тяжёлый, в избыток
+    которого попадает начало его недостачи, а порог тяжёлого j — 1 минус
+    перелёт первой накопленной недостачи D ≥ E_j через E_j. Оба поиска —
+    np.searchsorted, без цикла Python по n.
+    """
+
+    def __init__(self, cumulative):
+        q = probabilities_from_cumulative(cumulative)
+        n = len(q)
+        scaled = q * n
+        prob = np.ones(n)
+        alias = np.arange(n)
+        # Нулевые вероятности в начале списка лёгких: они разбираются первыми и
+        # никогда не остаются «полными» столбцами из-за ошибок округления
+        light = np.concatenate((np.flatnonzero(scaled == 0.0),
+                                np.flatnonzero((scaled > 0.0) & (scaled < 1.0))))
+        heavy = np.flatnonzero(scaled >= 1.0)
+        if len(light) and len(heavy):
+            D = np.concatenate(([0.0], np.cumsum(1.0 - scaled[light])))
+            E = np.cumsum(scaled[heavy] - 1.0)
+            # Лёгкий: тяжёлый, у которого к его началу D ещё остался избыток
+            j = np.searchsorted(E, D[:-1], side="right")
+            ok = j < len(heavy)   # за пределами — только ошибки округления
+            prob[light[ok]] = scaled[light[ok]]
+            alias[light[ok]] = heavy[j[ok]]
+            # Тяжёлый: порог 1 - перелёт, псевдоним — следующий тяжёлый
+            i = np.searchsorted(D, E, side="left")
+            ok = (i < len(D)) & (np.arange(len(heavy)) < len(heavy) - 1)
+            prob[heavy[ok]] = np.clip(1.0 - (D[i[ok]] - E[ok]), 0.0, 1.0)
+            alias[heavy[ok]] = heavy[np.flatnonzero(ok) + 1]
+        # Остальные столбцы заполнены целиком (с точностью до округления)
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample_indices(self, size, rng):
+        # Одно равномерное число: целая часть — столбец, дробная — выбор внутри него
+        u = rng.random(size) * len(self.prob)
+        col = u.astype(np.intp)
+        np.minimum(col, len(self.prob) - 1, out=col)
+        u -= col
+        return np.where(u < self.prob[col], col, self.alias[col])
+
+
+class GuideTable:
+    """Индексная таблица Чена: guide[j] — первый ключ, больший j/m.
+
+    size — число ячеек m (по умолчанию равно числу значений n); чем больше m,
+    тем короче перебор после прыжка, но тем больше памяти.
+    """
+
+    def __init__(self, cumulative, size=None):
+        keys = np.clip(np.asarray(cumulative, dtype=float), 0.0, 1.0)
+        keys[-1] = 1.0  # u, не меньшее всех ключей, даёт последнее значение
+        self.keys = keys
+        m = size or len(keys)
+        self.guide = np.searchsorted(keys, np.arange(m) / m, side="right")
+
+    def sample_indices(self, size, rng):
+        u = rng.random(size)
+        idx = self.guide[(u * len(self.guide)).astype(np.intp)]
+        # Перебор вперёд только для тех u, что ещё не меньше своего ключа
+        active = np.flatnonzero(self.keys[idx] <= u)
+        while active.size:
+            idx[active] += 1
+            active = active[self.keys[idx[active]] <= u[active]]
+        return idx
+
+
+def _fenwick(cumulative):
+    from fenwick import FenwickSampler  # fenwick.py сам импортирует этот модуль
+
+    return FenwickSampler.from_cumulative(cumulative)
+
+
+DEFAULT_GUIDE_FACTOR = 1.0
+
+
+def _guide(cumulative, guide_factor=DEFAULT_GUIDE_FACTOR):
+    # Число ячеек m = guide_factor·n, но не меньше одной
+    if not guide_factor > 0:
+        raise ValueError("guide_factor должен быть > 0")
+    return GuideTable(cumulative, max(1, int(round(guide_factor * len(cumulative)))))
+
+
+# Фабрики: по ключам строят функцию sample_indices(size, rng); именованные
+# параметры — настройки способа (guide_factor для "guide"), прочим не нужны
+SAMPLERS = {
+    "searchsorted": lambda cumulative, **_: (
+        lambda size, rng: sample_indices_searchsorted(cumulative, size, rng)),
+    "alias": lambda cumulative, **_: AliasTable(cumulative).sample_indices,
+    "guide": lambda cumulative, guide_factor=DEFAULT_GUIDE_FACTOR, **_: (
+        _guide(cumulative, guide_factor).sample_indices),
+    "fenwick": lambda cumulative, **_: _fenwick(cumulative).sample_indices,
+}
+ENGINES = ("loop", *SAMPLERS)
+
+
+def make_sampler(engine, cumulative, **options):
+    try:
+        factory = SAMPLERS[engine]
+    except KeyError:
+        raise ValueError(f"Неизвестный векторный способ '{engine}'. "
+                         f"Доступны: {', '.join(SAMPLERS)}") from None
+    return factory(cumulative, **options)
+
+
+def simulate_samples_with_counts(x, cumulative, n_samples, engine="loop", rng=None,
+                                 guide_factor=DEFAULT_GUIDE_FACTOR):
+    if engine == "loop":
+        return _simulate_loop(x, cumulative, n_samples)
+    rng = np.random.default_rng() if rng is None else rng
+    idx = make_sampler(engine, cumulative, guide_factor=guide_factor)(n_samples, rng)
+    samples = np.asarray(x, dtype=float)[idx]
+    counts = np.bincount(idx, minlength=len(x))
+    return samples, counts
+
+
+# ---- Потоковый режим: только первые q значений и счётчики ----
+DEFAULT_CHUNK = 1 << 22
+
+
+def moments_from_counts(x, counts):
+    """m и Dx по счётчикам попаданий (без самой выборки)."""
+    x = np.asarray(x, dtype=float)
+    counts = np.asarray(counts, dtype=np.int64)
+    N = counts.sum()
+    weights = counts / N
+    m = np.dot(weights, x)
+    Dx = np.dot(weights, (x - m) ** 2)
+    return m, Dx
+
+
+def _draw_counts(sample_indices, x, counts, first_q, size, q, rng, chunk_size):
+    # Добавляет size значений к счётчикам (на месте), возвращает новые first_q
+    done = 0
+    while done < size:
+        block = min(chunk_size, size - done)
+        idx = sample_indices(block, rng)
+        if len(first_q) < q:
+            first_q = np.concatenate((first_q, x[idx[:q - len(first_q)]]))
+        counts += np.bincount(idx, minlength=len(x))
+        done += block
+    return first_q
+
+
+def simulate_counts(x, cumulative, N, q, engine="alias", rng=None, chunk_size=DEFAULT_CHUNK,
+                    guide_factor=DEFAULT_GUIDE_FACTOR):
+    """Первые q значений, счётчики K, m и Dx при памяти O(chunk_size + len(x))."""
+    rng = np.random.default_rng() if rng is None else rng
+    sample_indices = make_sampler(engine, cumulative, guide_factor=guide_factor)
+    x_arr = np.asarray(x, dtype=float)
+    counts = np.zeros(len(x), dtype=np.int64)
+    first_q = _draw_counts(sample_indices, x_arr, counts, np.empty(0), N, q, rng, chunk_size)
+    m, Dx = moments_from_counts(x_arr, counts)
+    return first_q, counts, m, Dx
+
+
+# ---- Последовательное правило остановки ----
+def half_widths(x, counts, level=0.95):
+    """Полуширины доверительных интервалов для m и Dx по счётчикам.
+
+    Для m: z·sqrt(Dx/N); для Dx: z·sqrt((μ4 - Dx²)/N), где μ4 — четвёртый
+    центральный момент выборки (асимптотическая нормальность выборочной дисперсии).
+    """
+    x = np.asarray(x, dtype=float)
+    counts = np.asarray(counts, dtype=np.int64)
+    N = counts.sum()
+    m, Dx = moments_from_counts(x, counts)
+    mu4 = np.dot(counts / N, (x - m) ** 4)
+    z = NormalDist().inv_cdf((1 + level) / 2)
+    return z * np.sqrt(Dx / N), z * np.sqrt(max(mu4 - Dx ** 2, 0.0) / N)
+
+
+def simulate_until(x, cumulative, tol, q, engine="alias", rng=None, tol_D=None, level=0.95,
+                   n_start=10_000, growth=4.0, max_N=10**10, chunk_size=DEFAULT_CHUNK,
+                   guide_factor=DEFAULT_GUIDE_FACTOR):
+    """Генерация партиями до тех пор, пока полуширины интервалов для m и Dx
+    не станут меньше tol (и tol_D для дисперсии, по умолчанию тоже tol).
+
+    Размер следующей партии прогнозируется по закону 1/sqrt(N): нужно
+    N·(h/tol)² значений, но не больше чем в growth раз от текущего N —
+    ранние оценки дисперсии по малой выборке бывают неточны.
+    Возвращает (first_q, counts, m, Dx, info), info — N, число партий,
+    полуширины, время и признак достижения точности.
+    """
+    tol_D = tol if tol_D is None else tol_D
+    rng = np.random.default_rng() if rng is None else rng
+    start = time.perf_counter()
+    sample_indices = make_sampler(engine, cumulative, guide_factor=guide_factor)
+    x_arr = np.asarray(x, dtype=float)
+    counts = np.zeros(len(x), dtype=np.int64)
+    first_q = np.empty(0)
+    N, batches, target = 0, 0, min(n_start, max_N)
+    while True:
+        first_q = _draw_counts(sample_indices, x_arr, counts, first_q, target - N, q, rng, chunk_size)
+        N, batches = target, batches + 1
+        h_m, h_D = half_widths(x_arr, counts, level)
+        ratio = max(h_m / tol, h_D / tol_D)
+        if ratio <= 1.0 or N >= max_N:
+            break
+        needed = int(np.ceil(N * ratio ** 2 * 1.05))
+        target = int(min(max_N, max(needed, N + n_start), N * growth))
+
+    m, Dx = moments_from_counts(x_arr, counts)
+    info = {
+        "N": N, "batches": batches, "level": level,
+        "half_width_m": float(h_m), "half_width_D": float(h_D),
+        "converged": bool(ratio <= 1.0), "seconds": time.perf_counter() - start,
+    }
+    return first_q, counts, m, Dx, info
+
+
+def compute_m_dx(samples):
+    samples = np.asarray(samples, dtype=float)
+    m = samples.mean()
+    m2 = np.dot(samples, samples) / len(samples)
+    Dx = m2 - m ** 2
+    return m, Dx
+
+
+# ---- Полный расчёт для одного набора (X, P, N, q) ----
+def run(x, p, N, q, engine="alias", rng=None, chunk_size=DEFAULT_CHUNK, tol=None,
+        guide_factor=DEFAULT_GUIDE_FACTOR, **until):
+    p = normalize(p)
+    cumulative = build_cumulative(p)
+    return run_prepared(x, p, cumulative, N, q, engine, rng, chunk_size, tol, guide_factor, **until)
+
+
+def run_prepared(x, p, cumulative, N, q, engine="alias", rng=None, chunk_size=DEFAULT_CHUNK,
+                 tol=None, guide_factor=DEFAULT_GUIDE_FACTOR, **until):
+    """Расчёт по уже нормализованным P и готовым ключам (например, из loader.py).
+
+    При заданном tol N — верхняя граница, а фактический объём выбирает
+    simulate_until; сведения об остановке возвращаются в ключе "stop".
+    """
+    Mx, g = theory(x, p)
+    stop = None
+    if tol is not None:
+        if engine == "loop":
+            raise ValueError("Правило остановки работает только с векторными способами")
+        first_q, counts, m, Dx, stop = simulate_until(
+            x, cumulative, tol, q, engine, rng, max_N=N, chunk_size=chunk_size,
+            guide_factor=guide_factor, **until)
+        N = stop["N"]
+    elif engine == "loop":
+        samples, counts = simulate_samples_with_counts(x, cumulative, N, engine)
+        m, Dx = compute_m_dx(samples)
+        first_q = samples[:q]
+    else:
+        first_q, counts, m, Dx = simulate_counts(x, cumulative, N, q, engine, rng, chunk_size,
+                                                 guide_factor)
+    return {
+        "x": x, "p": p, "N": N, "q": q,
+        "cumulative": cumulative,
+        "counts": counts,
+        "first_q": [float(v) for v in first_q],
+        "Mx": Mx, "m": m, "delta_m": abs(m - Mx),
+        "g": g, "Dx": Dx, "delta_g": abs(Dx - g),
+        "stop": stop,
+    }
@@ -0,0 +1,116 @@
+"""
+fenwick.py
+Дискретная СВ с изменяемыми вероятностями: дерево Фенвика (двоичное
+индексированное дерево) над весами значений.
+Изменение одной вероятности и выбор одного номера — O(log n) вместо
+перестройки всех ключей за O(n). Выбор номеров для партии выполняется
+векторно: спуск по дереву идёт сразу для всех чисел, log2(n) шагов NumPy.
+
+Веса хранятся целыми «тиками» (по умолчанию 2**40 на единицу вероятности),
+а случайное число — целое t из [0, сумма тиков). Поэтому результат точно,
+без ошибок округления, совпадает с поиском по заново построенным ключам:
+    np.searchsorted(np.cumsum(ticks), t, side="right")
+Вероятности меньше 1/resolution округляются до нуля.
+
+Пример:
+    s = FenwickSampler([0.7, 0.1, 0.2])
+    idx = s.sample_indices(10**6, rng)
+    s.update(1, 0.5)          # p[1] = 0.5, остальные веса не меняются
+    idx = s.sample_indices(10**6, rng)
+"""
+
+import numpy as np
+
+import discrete
+
+
+class FenwickSampler:
+    """Выбор номера с вероятностью p_i / Σp по дереву Фенвика.
+
+    p — веса (не обязательно нормированные); resolution — число тиков на
+    единицу суммы исходных весов.
+    """
+
+    def __init__(self, p, resolution=1 << 40):
+        p = np.asarray(p, dtype=float)
+        if p.ndim != 1 or len(p) == 0:
+            raise ValueError("Нужен непустой одномерный список весов")
+        if np.any(p < 0):
+            raise ValueError("Вероятности не могут быть отрицательными")
+        total = p.sum()
+        if not 0 < total < np.inf:
+            raise ValueError("Сумма весов должна быть положительной и конечной")
+        self.scale = resolution / total
+        self.ticks = np.rint(p * self.scale).astype(np.int64)
+        self._build()
+
+    @classmethod
+    def from_cumulative(cls, cumulative, resolution=1 << 40):
+        """Сэмплер с тем же распределением номеров, что и поиск по ключам."""
+        return cls(discrete.probabilities_from_cumulative(cumulative), resolution)
+
+    def _build(self):
+        # tree[i] = сумма тиков на участке (i - lowbit(i), i]; строится за O(n) векторно
+        n = len(self.ticks)
+        prefix = np.concatenate(([0], np.cumsum(self.ticks)))
+        i = np.arange(1, n + 1)
+        self._top = 1 << (n.bit_length() - 1)
+        # Хвост до 2·top заполнен максимумом int64: спуск туда никогда не заходит,
+        # и в find() не нужны проверки выхода за n
+        self.tree = np.full(2 * self._top, np.iinfo(np.int64).max, dtype=np.int64)
+        self.tree[0] = 0
+        self.tree[1:n + 1] = prefix[i] - prefix[i - (i & -i)]
+        self.total = int(prefix[-1])
+
+    def __len__(self):
+        return len(self.ticks)
+
+    # ---- Изменение вероятностей ----
+    def update(self, i, p_i):
+        """p[i] = p_i (в единицах исходных весов) за O(log n)."""
+        # Отрицательный i не поддерживается: ticks[-1] изменился бы, а цикл
+        # по дереву с j = 0 не завершился бы
+        if not 0 <= i < len(self):
+            raise IndexError(f"Номер {i} вне диапазона 0..{len(self) - 1}")
+        if p_i < 0:
+            raise ValueError("Вероятности не могут быть отрицательными")
+        new = int(round(p_i * self.scale))
+        delta = new - int(self.ticks[i])
+        self.ticks[i] = new
+        self.total += delta
+        j, n = i + 1, len(self.ticks)
+        while j <= n:
+            self.tree[j] += delta
+            j += j & -j
+
+    def update_many(self, indices, values):
+        for i, p_i in zip(indices, values):
+            self.update(int(i), float(p_i))
+
+    # ---- Текущее распределение ----
+    def probabilities(self):
+        return self.ticks / self.total
+
+    def cumulative(self):
+        """Ключи текущего распределения (как build_cumulative после нормализации)."""
+        return np.cumsum(self.ticks) / self.total
+
+    # ---- Выбор номеров ----
+    def find(self, t):
+        """Первый номер i с суммой тиков ticks[0..i] > t (t — целые из [0, total))."""
+        t = np.array(t, dtype=np.int64)
+        pos = np.zeros(t.shape, dtype=np.int64)
+        step = self._top
+        while step:
+            nxt = pos + step
+            value = self.tree[nxt]
+            ok = value <= t
+            t -= np.where(ok, value, 0)
+            np.copyto(pos, nxt, where=ok)
+            step >>= 1
+        return pos
+
+    def sample_indices(self, size, rng):
+        if self.total <= 0:
+            raise ValueError("Сумма вероятностей равна нулю")
+        return self.find(rng.integers(0, self.total, size))
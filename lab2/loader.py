@@ -0,0 +1,94 @@
+"""
+loader.py
+Загрузка X и P для лабораторной 2 из файлов .npy или CSV.
+Файлы .npy отображаются в память (np.load с mmap_mode="c": копирование при
+записи, исходный файл не меняется). CSV разбирается один раз и сохраняется
+рядом как .npy, при следующих запусках берётся отображение этого файла.
+Нормализация вероятностей и ключи считаются векторно, без списков Python.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+def _sniff(path):
+    # Разделитель и наличие заголовка по первой строке файла
+    with open(path, encoding="utf-8") as fh:
+        first = fh.readline()
+    sep = "," if "," in first else ";" if ";" in first else None
+    try:
+        [float(v) for v in (first.split(sep) if sep else first.split())]
+        header = False
+    except ValueError:
+        header = True
+    return sep, header
+
+
+def _read_csv(path):
+    sep, header = _sniff(path)
+    try:
+        import pandas as pd
+    except ImportError:
+        return np.loadtxt(path, delimiter=sep, skiprows=int(header), ndmin=2)
+    frame = pd.read_csv(path, sep=sep or r"\s+", header=0 if header else None)
+    return frame.to_numpy(dtype=np.float64)
+
+
+def load_array(path, cache=True):
+    """Массив из .npy (отображение в память) или из CSV (с кэшем .npy рядом)."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        return np.load(path, mmap_mode="c")
+
+    cached = path.with_name(path.name + ".npy")
+    if cache and cached.exists() and cached.stat().st_mtime >= path.stat().st_mtime:
+        return np.load(cached, mmap_mode="c")
+    data = _read_csv(path)
+    if data.shape[1] == 1:
+        data = data[:, 0]
+    if cache:
+        # Своё временное имя у каждого процесса: воркеры batch.py могут
+        # одновременно разбирать один и тот же CSV
+        with tempfile.NamedTemporaryFile(dir=cached.parent, prefix=cached.name + ".",
+                                         suffix=".tmp", delete=False) as fh:
+            np.save(fh, data)
+        try:
+            os.replace(fh.name, cached)
+        except OSError:
+            os.unlink(fh.name)
+            raise
+        return np.load(cached, mmap_mode="c")
+    return data
+
+
+def load_xp(x_path, p_path=None, cache=True):
+    """X, P и ключи из файлов.
+
+    Если p_path не задан, x_path содержит два столбца: X и P.
+    Вероятности нормализуются на месте (в копии при записи, не в файле).
+    """
+    if p_path is None:
+        data = load_array(x_path, cache)
+        if data.ndim != 2 or data.shape[1] < 2:
+            raise ValueError(f"❌ В файле {x_path} нужны два столбца: X и P")
+        x, p = data[:, 0], data[:, 1]
+    else:
+        x, p = load_array(x_path, cache), load_array(p_path, cache)
+    # Целые P (например, частоты) приводятся к float: иначе деление на месте невозможно
+    p = p.astype(np.float64, copy=False)
+    if x.shape != p.shape:
+        raise ValueError("❌ Количество значений X и вероятностей P должно совпадать")
+    if np.any(p < 0):
+        raise ValueError("❌ Вероятности не могут быть отрицательными")
+
+    total = p.sum()
+    if total <= 0:
+        raise ValueError("❌ Сумма вероятностей должна быть больше нуля")
+    if abs(total - 1.0) > 1e-6:
+        print("⚠️ Сумма вероятностей не равна 1, нормализуем.")
+        p /= total
+    cumulative = np.cumsum(p)
+    return x, p, cumulative
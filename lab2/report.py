@@ -0,0 +1,127 @@
+"""
+report.py
+Вывод результатов лабораторной 2: текст в консоль, таблица и данные на рисунке.
+matplotlib импортируется только при построении рисунка; в пакетном режиме
+используется matplotlib.figure.Figure без pyplot, поэтому фигуры не копятся.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+# Больше значений не выводим поимённо: для эмпирических таблиц с миллионами строк
+MAX_LISTED = 50
+
+HEADER = ["N", "Mx (теор.)", "m (выбор.)", "Δm", "g (теор.)", "Dx (выбор.)", "Δg"]
+FIELDS = ["N", "Mx", "m", "delta_m", "g", "Dx", "delta_g"]
+
+
+def _short(values, cast=float):
+    head = [cast(v) for v in values[:MAX_LISTED]]
+    return f"{head}" if len(values) <= MAX_LISTED else f"{head} ... (всего {len(values)})"
+
+
+def print_results(res):
+    n = len(res["counts"])
+    if n > MAX_LISTED:
+        counts = np.asarray(res["counts"])
+        print(f"\nЗначений X: {n}; ключи и попадания не выводятся поимённо.")
+        print(f"Попаданий: всего {counts.sum()}, ненулевых диапазонов {np.count_nonzero(counts)}")
+        print(f"\nПервые {res['q']} значений выборки:")
+        print(res["first_q"])
+        return
+
+    print("\nКлючи (кумулятивные вероятности):", [float(c) for c in res["cumulative"]])
+
+    # ---- Вывод первых q значений ----
+    print(f"\nПервые {res['q']} значений выборки:")
+    print(res["first_q"])
+
+    # ---- Вывод количества попаданий в диапазоны ----
+    print("\nКоличество попаданий в каждый диапазон (K):")
+    cumulative = res["cumulative"]
+    for i, c in enumerate(int(c) for c in res["counts"]):
+        range_start = 0 if i == 0 else cumulative[i-1]
+        range_end = cumulative[i]
+        print(f"{i+1}) Диапазон [{range_start:.4f}, {range_end:.4f}) → {c} попаданий")
+
+
+def draw_results(fig, res, header=HEADER):
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.axis('off')
+    ax2.axis('off')
+
+    # ---- Таблица результатов ----
+    table_data = [header]
+    table_data.append([res["N"]] + [f"{res[k]:.6f}" for k in FIELDS[1:]])
+    table = ax1.table(cellText=table_data, loc='center', cellLoc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1.2, 1.5)
+    ax1.set_title("Результаты моделирования", fontsize=12)
+
+    # ---- Блок текста с данными ----
+    text_lines = [
+        "Условие:",
+        f"X: {_short(res['x'])}",
+        f"P: {_short(res['p'])}",
+        "",
+        "Ключи (кумулятивные вероятности):",
+        f"{_short(res['cumulative'], lambda c: round(float(c), 4))}",
+        "",
+        f"K (количество попаданий): {_short(res['counts'], int)}",
+        "",
+        f"Первые {res['q']} значений выборки:",
+        f"{list(res['first_q'])}"
+    ]
+    ax2.text(0, 1, "\n".join(text_lines), va='top', fontsize=10, family='monospace')
+    ax2.set_title("Условие и данные", fontsize=12)
+
+    fig.tight_layout()
+
+
+def show(res, header=HEADER):
+    import matplotlib.pyplot as plt
+
+    draw_results(plt.figure(figsize=(14, 5)), res, header)
+    plt.show()
+
+
+def save(res, out_dir, name="result", fmt="png", plots=True):
+    """Пакетный режим: числа в JSON и (по желанию) рисунок в файл."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = [out_dir / f"{name}.json"]
+    data = {k: res[k] for k in ["N", "q", *FIELDS[1:]]}
+    data["first_q"] = res["first_q"]
+    if res.get("stop"):
+        data["stop"] = res["stop"]
+    if len(res["counts"]) <= MAX_LISTED:
+        data.update({k: [float(v) for v in res[k]] for k in ["x", "p", "cumulative"]})
+        data["counts"] = [int(c) for c in res["counts"]]
+    else:
+        # Большие таблицы: счётчики отдельным бинарным файлом
+        paths.append(out_dir / f"{name}_counts.npy")
+        np.save(paths[-1], np.asarray(res["counts"], dtype=np.int64))
+        data["counts_file"] = paths[-1].name
+    paths[0].write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+    if plots:
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(14, 5))
+        draw_results(fig, res)
+        paths.append(out_dir / f"{name}.{fmt}")
+        fig.savefig(paths[-1])
+    return paths
+
+
+def write_rows(rows, path):
+    """Сводная таблица нескольких расчётов в CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(FIELDS)
+        for res in rows:
+            writer.writerow([res[k] for k in FIELDS])
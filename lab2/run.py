@@ -0,0 +1,116 @@
+"""
+run.py
+Пакетный запуск лабораторной 2 без ввода с клавиатуры и без окон.
+
+Примеры:
+    python run.py --x -7 1 2 --p 0.7 0.1 0.2 --N 100 1000 10000 --q 18 --out reports --plots
+    python run.py --xp-file table.csv --N 1e8          # два столбца X, P
+    python run.py --x-file x.npy --p-file p.npy --N 1e8
+    python run.py --x -7 1 2 --p 0.7 0.1 0.2 --tol 1e-3 --N 1e10   # N подбирается сам
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+import discrete
+import report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Моделирование дискретной СВ")
+    parser.add_argument("--x", nargs="+", type=float, default=None, help="значения X")
+    parser.add_argument("--p", nargs="+", type=float, default=None, help="вероятности P")
+    parser.add_argument("--xp-file", default=None, help="файл .npy/CSV со столбцами X и P")
+    parser.add_argument("--x-file", default=None, help="файл .npy/CSV со значениями X")
+    parser.add_argument("--p-file", default=None, help="файл .npy/CSV с вероятностями P")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="не сохранять разобранный CSV рядом в формате .npy")
+    parser.add_argument("--N", nargs="+", default=None,
+                        help="размеры выборки (по расчёту на каждое), допускается 1e10; "
+                             "по умолчанию 1000, а с --tol — граница 1e10")
+    parser.add_argument("--q", type=int, default=18, help="кол-во первых значений для вывода")
+    parser.add_argument("--engine", choices=list(discrete.ENGINES), default="alias",
+                        help="способ выбора значения по ключам")
+    parser.add_argument("--guide-factor", type=float, default=discrete.DEFAULT_GUIDE_FACTOR,
+                        help="для --engine guide: ячеек таблицы на одно значение (m = factor·n)")
+    parser.add_argument("--seed", type=int, default=None, help="seed генератора NumPy")
+    parser.add_argument("--chunk", type=int, default=discrete.DEFAULT_CHUNK,
+                        help="размер блока при потоковой генерации")
+    parser.add_argument("--tol", type=float, default=None,
+                        help="генерировать партиями, пока полуширина интервала для m "
+                             "и Dx не станет меньше tol (N — верхняя граница)")
+    parser.add_argument("--tol-D", type=float, default=None,
+                        help="отдельная точность для Dx (по умолчанию равна --tol)")
+    parser.add_argument("--level", type=float, default=0.95, help="доверительная вероятность")
+    parser.add_argument("--out", default=None, help="каталог для результатов")
+    parser.add_argument("--plots", action="store_true", help="сохранять рисунки")
+    parser.add_argument("--format", default="png", help="формат рисунков (png, svg, pdf)")
+    args = parser.parse_args(argv)
+    if args.guide_factor <= 0:
+        parser.error("--guide-factor должен быть > 0")
+    if args.plots and not args.out:
+        parser.error("--plots требует --out")
+    return args
+
+
+def prepare(args):
+    """X, нормализованные P и ключи из аргументов или из файлов."""
+    if args.xp_file or args.x_file:
+        import loader
+
+        try:
+            if args.xp_file:
+                return loader.load_xp(args.xp_file, cache=not args.no_cache)
+            if not args.p_file:
+                raise SystemExit("❌ Вместе с --x-file нужен --p-file")
+            return loader.load_xp(args.x_file, args.p_file, cache=not args.no_cache)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from None
+
+    if args.x is None or args.p is None:
+        raise SystemExit("❌ Задайте --x и --p или файл (--xp-file, --x-file/--p-file)")
+    if len(args.x) != len(args.p):
+        raise SystemExit("❌ Количество значений X и вероятностей P должно совпадать")
+    p = discrete.normalize(args.p)
+    return args.x, p, discrete.build_cumulative(p)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    x, p, cumulative = prepare(args)
+    print(f"Значений X: {len(x)}; загрузка и ключи: {(time.perf_counter() - start) * 1e3:.1f} мс")
+
+    rng = np.random.default_rng(args.seed)
+    rows = []
+    N_values = args.N or (["1e10"] if args.tol is not None else ["1000"])
+    for N in (int(float(N)) for N in N_values):
+        until = {} if args.tol is None else {"tol_D": args.tol_D, "level": args.level}
+        try:
+            res = discrete.run_prepared(x, p, cumulative, N, args.q, args.engine, rng,
+                                        args.chunk, args.tol, args.guide_factor, **until)
+        except ValueError as exc:
+            raise SystemExit(f"❌ {exc}") from None
+        N = res["N"]
+        if res["stop"]:
+            stop = res["stop"]
+            print(f"Остановка: N = {N} за {stop['batches']} партий, {stop['seconds']:.3f} с; "
+                  f"полуширины m ±{stop['half_width_m']:.3g}, Dx ±{stop['half_width_D']:.3g}"
+                  + ("" if stop["converged"] else " — точность не достигнута, N упёрся в --N"))
+        rows.append(res)
+        print(f"N = {N}: m = {res['m']:.6f}, Δm = {res['delta_m']:.6f}, "
+              f"Dx = {res['Dx']:.6f}, Δg = {res['delta_g']:.6f}")
+        if args.out:
+            report.save(res, args.out, f"N{N}", args.format, args.plots)
+
+    if args.out:
+        summary = Path(args.out) / "summary.csv"
+        report.write_rows(rows, summary)
+        print("Сохранено:", summary)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,13 @@
-import random
-import numpy as np
+import sys
+from pathlib import Path
+
 import streamlit as st
 
+# Общие модули приложений lab3–lab5 (кэш выборок, элементы интерфейса)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from widgets import (cache_caption, paged_table, seed_controls, session_store,  # noqa: E402
+                     shared_cache, store_caption)
+
 # ====== Настройки страницы ======
 st.set_page_config(page_title="Равномерное распределение", layout="centered")
 st.markdown(
@@ -40,20 +46,24 @@ with col2:
 with col3:
     N = st.number_input("", value=100, min_value=1, step=1, placeholder="N")
 
+seed = seed_controls()
+cache = shared_cache("lab3")
+
 # ====== Проверка ======
 if a >= b:
     st.error("❌ a должно быть меньше b")
 else:
-    # ====== Генерация выборки ======
-    samples = [random.uniform(a, b) for _ in range(N)]
+    # ====== Выборка сессии: при изменении только N догенерируется хвост ======
+    store = session_store(cache, ("uniform", a, b), seed,
+                          lambda rng, n: rng.uniform(a, b, n), N)
+    samples = store.take(N)
 
     # Теоретические значения
     Mx = (a + b) / 2
     g = ((b - a) ** 2) / 12
 
     # Выборочные значения
-    m = sum(samples) / N
-    Dx = sum((x - m) ** 2 for x in samples) / N
+    m, Dx = store.moments(N)
 
     # Δ1, Δ2
     delta_m = abs(m - Mx)
@@ -94,48 +104,8 @@ else:
         )
     st.markdown("---")
 
-    # ====== Таблица ======
-    first_20 = samples[:20]
-    first_20_arr = np.array(first_20).reshape(4, 5)
-    first_20_str = [[f"{v:.6f}" for v in row] for row in first_20_arr]
-
-    table_html = """
-    <style>
-    table {
-        border-collapse: collapse;
-        width: 100%;
-        font-size: 14px;
-    }
-    th {
-        background-color: #4C78A8;
-        color: white;
-        padding: 8px;
-        text-align: center;
-        border: 1px solid #ddd;
-    }
-    td {
-        padding: 8px;
-        border: 1px solid #ddd;
-        text-align: center;
-    }
-    tr:nth-child(even) {
-        background-color: #f2f2f2;
-    }
-    </style>
-    <h3 style="color:#4C78A8;">📋 Первые 20 значений</h3>
-    <table>
-        <tr>
-    """
-
-    # Заголовки столбцов
-    for j in range(5):
-        table_html += f"<th>Колонка {j+1}</th>"
-    table_html += "</tr>"
-
-    # Данные
-    for row in first_20_str:
-        table_html += "<tr>" + "".join(f"<td>{val}</td>" for val in row) + "</tr>"
-
-    table_html += "</table>"
+    # ====== Таблица: только видимая страница хранимой выборки ======
+    paged_table(samples)
+    store_caption(store, N)
+    cache_caption(cache)
 
-    st.markdown(table_html, unsafe_allow_html=True)
\ No newline at end of file
@@ -1,101 +1,127 @@
-import random
-import plotly.graph_objects as go
 import numpy as np
+import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-# ===== ВВОД ПАРАМЕТРОВ =====
-try:
-    a = float(input("Введите a (начало интервала): "))
-    b = float(input("Введите b (конец интервала): "))
-    N = int(input("Введите N (объём выборки): "))
-
-    if a >= b:
-        raise ValueError("❌ a должно быть меньше b")
-    if N <= 0:
-        raise ValueError("❌ N должно быть положительным числом")
-
-except ValueError as e:
-    print("Ошибка ввода:", e)
-    exit()
-
-# ===== ГЕНЕРАЦИЯ ВЫБОРКИ =====
-samples = [random.uniform(a, b) for _ in range(N)]
-
-# Теоретические значения
-Mx = (a + b) / 2
-g = ((b - a)**2) / 12
-
-# Выборочные значения
-m = sum(samples) / N
-Dx = sum((x - m) ** 2 for x in samples) / N
-
-# Δ1, Δ2
-delta_m = abs(m - Mx)
-delta_g = abs(Dx - g)
-
-# Первые 20 значений (4×5)
-first_20 = samples[:20]
-first_20_arr = np.array(first_20).reshape(4, 5)
-first_20_str = [[f"{v:.6f}" for v in row] for row in first_20_arr]
-
-# ===== СПИСОК ПАРАМЕТРОВ =====
-stats_text = [
-    f"a : {a}",
-    f"b : {b}",
-    f"N : {N}",
-    f"Δ1 : {delta_m:.6f}",
-    f"Δ2 : {delta_g:.6f}"
-]
-
-# ===== СОЗДАЁМ 2 РЯДА =====
-fig = make_subplots(
-    rows=2, cols=1,
-    row_heights=[0.4, 0.6],
-    subplot_titles=("Параметры", "Первые 20 значений"),
-    specs=[[{"type": "xy"}], [{"type": "table"}]]
-)
-
-# ===== РЯД 1 — текст =====
-for i, line in enumerate(stats_text):
-    fig.add_annotation(
-        text=line,
-        xref="x1", yref="y1",
-        x=0, y=1 - i*0.2,
-        showarrow=False,
-        font=dict(size=14, family="Arial"),
-        row=1, col=1
+
+# ===== ГЕНЕРАЦИЯ ВЫБОРКИ И ОЦЕНКИ =====
+def simulate(a, b, N, rng=None):
+    rng = np.random.default_rng() if rng is None else rng
+    samples = rng.uniform(a, b, N)
+
+    # Теоретические значения
+    Mx = (a + b) / 2
+    g = ((b - a)**2) / 12
+
+    # Выборочные значения
+    m = samples.mean()
+    Dx = samples.var()
+
+    return {"a": a, "b": b, "N": N, "first_20": samples[:20],
+            "delta_m": abs(m - Mx), "delta_g": abs(Dx - g)}
+
+
+# ===== РИСУНОК: ПАРАМЕТРЫ И ПЕРВЫЕ 20 ЗНАЧЕНИЙ =====
+def _stats_text(res):
+    return [
+        f"a : {res['a']}",
+        f"b : {res['b']}",
+        f"N : {res['N']}",
+        f"Δ1 : {res['delta_m']:.6f}",
+        f"Δ2 : {res['delta_g']:.6f}"
+    ]
+
+
+def _table_columns(res):
+    # Первые 20 значений по 5 в строке (последняя строка дополняется пустыми)
+    first_20 = [f"{v:.6f}" for v in res["first_20"]]
+    first_20 += [""] * (-len(first_20) % 5)
+    first_20_str = [first_20[i:i + 5] for i in range(0, len(first_20), 5)]
+    return list(map(list, zip(*first_20_str)))
+
+
+def build_figure(res):
+    # ===== СОЗДАЁМ 2 РЯДА =====
+    fig = make_subplots(
+        rows=2, cols=1,
+        row_heights=[0.4, 0.6],
+        subplot_titles=("Параметры", "Первые 20 значений"),
+        specs=[[{"type": "xy"}], [{"type": "table"}]]
+    )
+
+    # ===== РЯД 1 — текст =====
+    for i, line in enumerate(_stats_text(res)):
+        fig.add_annotation(
+            text=line,
+            xref="x1", yref="y1",
+            x=0, y=1 - i*0.2,
+            showarrow=False,
+            font=dict(size=14, family="Arial"),
+            row=1, col=1
+        )
+
+    # Прячем оси у текстового блока
+    fig.update_xaxes(visible=False, row=1, col=1)
+    fig.update_yaxes(visible=False, row=1, col=1)
+
+    # ===== Горизонтальная черта между параметрами и таблицей =====
+    fig.add_shape(
+        type="line",
+        x0=0, x1=1, y0=0, y1=0,
+        xref="paper", yref="paper",
+        line=dict(color="black", width=2)
+    )
+
+    # ===== РЯД 2 — таблица =====
+    fig.add_trace(
+        go.Table(
+            header=dict(values=["", "", "", "", ""],
+                        fill_color="paleturquoise",
+                        align="center"),
+            cells=dict(values=_table_columns(res),
+                       fill_color="lavender",
+                       align="center")
+        ),
+        row=2, col=1
     )
 
-# Прячем оси у текстового блока
-fig.update_xaxes(visible=False, row=1, col=1)
-fig.update_yaxes(visible=False, row=1, col=1)
-
-# ===== Горизонтальная черта между параметрами и таблицей =====
-fig.add_shape(
-    type="line",
-    x0=0, x1=1, y0=0, y1=0,
-    xref="paper", yref="paper",
-    line=dict(color="black", width=2)
-)
-
-# ===== РЯД 2 — таблица =====
-fig.add_trace(
-    go.Table(
-        header=dict(values=["", "", "", "", ""],
-                    fill_color="paleturquoise",
-                    align="center"),
-        cells=dict(values=list(map(list, zip(*first_20_str))),
-                   fill_color="lavender",
-                   align="center")
-    ),
-    row=2, col=1
-)
-
-# ===== ОБЩАЯ КОНФИГУРАЦИЯ =====
-fig.update_layout(
-    width=600,
-    height=500,
-    title_text="Равномерное распределение"
-)
-
-fig.show()
\ No newline at end of file
+    # ===== ОБЩАЯ КОНФИГУРАЦИЯ =====
+    fig.update_layout(
+        width=600,
+        height=500,
+        title_text="Равномерное распределение"
+    )
+    return fig
+
+
+def update_figure(fig, res):
+    """Новые параметры и таблица в уже построенном рисунке (пакетный режим:
+    make_subplots и оформление не повторяются для каждого набора)."""
+    lines = _stats_text(res)
+    # Первые две подписи — заголовки рядов, дальше строки параметров
+    for annotation, line in zip(fig.layout.annotations[-len(lines):], lines):
+        annotation.text = line
+    fig.data[0].cells.values = _table_columns(res)
+    return fig
+
+
+def main():
+    # ===== ВВОД ПАРАМЕТРОВ =====
+    try:
+        a = float(input("Введите a (начало интервала): "))
+        b = float(input("Введите b (конец интервала): "))
+        N = int(input("Введите N (объём выборки): "))
+
+        if a >= b:
+            raise ValueError("❌ a должно быть меньше b")
+        if N <= 0:
+            raise ValueError("❌ N должно быть положительным числом")
+
+    except ValueError as e:
+        print("Ошибка ввода:", e)
+        return
+
+    build_figure(simulate(a, b, N)).show()
+
+
+if __name__ == '__main__':
+    main()
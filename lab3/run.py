@@ -0,0 +1,99 @@
+"""
+run.py
+Пакетный режим лабораторной 3: отчёты plotly в файлы HTML без браузера.
+
+Каждый набор параметров — отдельный самодостаточный HTML; библиотека
+plotly.js не встраивается в каждый файл (это ~4.5 МБ), а один раз копируется
+в каталог отчётов как plotly.min.js (include_plotlyjs="directory").
+Рисунок строится один раз, в следующих отчётах меняются только подписи
+с параметрами и ячейки таблицы.
+
+Примеры:
+    python run.py --params 2 5 100 --params 0 1 1e6 --out reports
+    python run.py --jobs params.csv --out reports --seed 1   # столбцы a,b,N
+"""
+
+import argparse
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from main import build_figure, simulate, update_figure
+
+
+def load_params(path):
+    """Наборы (a, b, N) из JSON (список объектов) или CSV с заголовком a,b,N."""
+    path = Path(path)
+    if path.suffix == ".json":
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        with open(path, newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+    return [(float(r["a"]), float(r["b"]), int(float(r["N"]))) for r in rows]
+
+
+def write_report(res, path, fig=None):
+    """Рисунок в HTML; возвращает рисунок (для следующего отчёта) и время
+    построения и записи в секундах."""
+    start = time.perf_counter()
+    fig = build_figure(res) if fig is None else update_figure(fig, res)
+    built = time.perf_counter()
+    fig.write_html(path, include_plotlyjs="directory", full_html=True)
+    return fig, built - start, time.perf_counter() - built
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Отчёты lab3 в HTML (пакетный режим)")
+    parser.add_argument("--params", nargs=3, action="append", default=[], metavar=("A", "B", "N"),
+                        help="набор параметров (можно повторять)")
+    parser.add_argument("--jobs", default=None, help="файл наборов параметров (.csv или .json)")
+    parser.add_argument("--seed", type=int, default=None, help="seed генератора NumPy")
+    parser.add_argument("--out", default="reports", help="каталог для отчётов")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    params = [(float(a), float(b), int(float(N))) for a, b, N in args.params]
+    if args.jobs:
+        params += load_params(args.jobs)
+    if not params:
+        raise SystemExit("❌ Задайте наборы параметров: --params a b N или --jobs файл")
+    bad = [p for p in params if p[0] >= p[1] or p[2] <= 0]
+    if bad:
+        raise SystemExit(f"❌ Нужно a < b и N > 0: {bad}")
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    seeds = np.random.SeedSequence(args.seed).spawn(len(params))
+    rows = []
+    fig = None  # строится один раз, для остальных отчётов меняются только данные
+    total = time.perf_counter()
+    for k, ((a, b, N), seed) in enumerate(zip(params, seeds), 1):
+        start = time.perf_counter()
+        res = simulate(a, b, N, np.random.default_rng(seed))
+        sim = time.perf_counter() - start
+        path = out_dir / f"report_{k:04d}.html"
+        fig, build, write = write_report(res, path, fig)
+        rows.append({"file": path.name, "a": a, "b": b, "N": N,
+                     "delta_m": res["delta_m"], "delta_g": res["delta_g"],
+                     "simulate_s": sim, "figure_s": build, "write_s": write,
+                     "bytes": path.stat().st_size})
+        print(f"{path.name}: a={a}, b={b}, N={N} — выборка {sim * 1e3:.1f} мс, "
+              f"рисунок {build * 1e3:.1f} мс, запись {write * 1e3:.1f} мс, "
+              f"{rows[-1]['bytes'] / 1024:.0f} КБ")
+
+    summary = out_dir / "summary.csv"
+    with open(summary, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Отчётов: {len(rows)}, всего {time.perf_counter() - total:.2f} с")
+    print("Сохранено:", summary)
+
+
+if __name__ == '__main__':
+    main()
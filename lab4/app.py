@@ -1,7 +1,18 @@
-import random
+import sys
+from pathlib import Path
+
 import numpy as np
+import pandas as pd
 import streamlit as st
 
+# Общие модули приложений lab3–lab5 (кэш выборок, элементы интерфейса)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from widgets import (cache_caption, paged_table, seed_controls, session_store,  # noqa: E402
+                     shared_cache, store_caption)
+
+import poisson  # noqa: E402
+import sweep  # noqa: E402
+
 # ====== Настройки страницы ======
 st.set_page_config(page_title="Показательное распределение", layout="centered")
 st.markdown(
@@ -38,20 +49,24 @@ with col1:
 with col2:
     N = st.number_input("", value=100, min_value=1, step=1, placeholder="N")
 
+seed = seed_controls()
+cache = shared_cache("lab4")
+
 # ====== Проверка ======
 if lambd <= 0:
     st.error("❌ λ должно быть > 0")
 else:
-    # ====== Генерация выборки ======
-    samples = [random.expovariate(lambd) for _ in range(N)]
+    # ====== Выборка сессии: при изменении только N догенерируется хвост ======
+    store = session_store(cache, ("exponential", lambd), seed,
+                          lambda rng, n: rng.exponential(1 / lambd, n), N)
+    samples = store.take(N)
 
     # Теоретические значения
     Mx = 1 / lambd
     Dx_theor = 1 / (lambd ** 2)
 
     # Выборочные значения
-    m = sum(samples) / N
-    Dx = sum((x - m) ** 2 for x in samples) / N
+    m, Dx = store.moments(N)
 
     # Δ1, Δ2
     delta_m = abs(m - Mx)
@@ -92,50 +107,90 @@ else:
         )
     st.markdown("---")
 
-    # ====== Таблица первых 20 значений ======
-    first_20 = samples[:20]
-    rows = (len(first_20) + 4) // 5  # число строк
-
-    first_20_arr = np.array(first_20 + [None] * (rows * 5 - len(first_20))).reshape(rows, 5)
-    first_20_str = [[("" if v is None else f"{v:.6f}") for v in row] for row in first_20_arr]
-
-    table_html = """
-    <style>
-    table {
-        border-collapse: collapse;
-        width: 100%;
-        font-size: 14px;
-    }
-    th {
-        background-color: #4C78A8;
-        color: white;
-        padding: 8px;
-        text-align: center;
-        border: 1px solid #ddd;
-    }
-    td {
-        padding: 8px;
-        border: 1px solid #ddd;
-        text-align: center;
-    }
-    tr:nth-child(even) {
-        background-color: #f2f2f2;
-    }
-    </style>
-    <h3 style="color:#4C78A8;">📋 Первые 20 значений</h3>
-    <table>
-        <tr>
-    """
-
-    # Заголовки столбцов
-    for j in range(5):
-        table_html += f"<th>Колонка {j+1}</th>"
-    table_html += "</tr>"
-
-    # Данные
-    for row in first_20_str:
-        table_html += "<tr>" + "".join(f"<td>{val}</td>" for val in row) + "</tr>"
-
-    table_html += "</table>"
-
-    st.markdown(table_html, unsafe_allow_html=True)
\ No newline at end of file
+    # ====== Таблица: только видимая страница хранимой выборки ======
+    paged_table(samples)
+    store_caption(store, N)
+
+    # ====== Пуассоновский поток: число событий в окнах ======
+    st.markdown("---")
+    if st.checkbox("⏱ Пуассоновский поток (счёт событий по окнам)"):
+        c1, c2 = st.columns(2)
+        with c1:
+            n_events = st.number_input("Событий", value=10**6, min_value=1, max_value=10**9,
+                                       step=10**6)
+        with c2:
+            window = st.number_input("Длина окна", value=1.0, min_value=1e-6, format="%.4f")
+
+        flow = cache.get(
+            ("poisson", lambd, n_events, window, seed),
+            lambda: poisson.count_process(lambd, n_events, window, np.random.default_rng(seed)))
+
+        if flow["windows"] == 0:
+            # Поток кончился раньше первого окна: статистика по окнам не определена
+            st.warning(f"Ни одно окно не завершилось: время потока T = {flow['T']:.4f} "
+                       f"меньше длины окна. Уменьшите окно или увеличьте число событий.")
+        else:
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Среднее в окне", f"{flow['mean_count']:.4f}",
+                      f"λ·окно = {flow['expected_count']:.4f}", delta_color="off")
+            c2.metric("Дисперсия в окне", f"{flow['var_count']:.4f}")
+            c3.metric("Индекс дисперсии D/M", f"{flow['dispersion']:.4f}", "для Пуассона 1",
+                      delta_color="off")
+
+            # Доли окон с k событиями и закон Пуассона с параметром λ·окно
+            # (только диапазон встретившихся k: при большом λ·окно нули слева не рисуем)
+            nz = np.flatnonzero(flow["freq"])
+            k = np.arange(nz[0], nz[-1] + 1)
+            st.bar_chart(pd.DataFrame({"выборка": flow["freq"][k] / flow["windows"],
+                                       "Пуассон": poisson.poisson_pmf(k, flow["expected_count"])},
+                                      index=k))
+            st.caption(f"Окон: {flow['windows']}, время потока T = {flow['T']:.1f}, "
+                       f"расчёт {flow['seconds']:.2f} с")
+
+    # ====== Сетка (λ, N): Δ1 и Δ2 для многих конфигураций сразу ======
+    st.markdown("---")
+    if st.checkbox("🗺 Сетка λ × N (тепловая карта ошибок)"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            lam_min = st.number_input("λ от", value=0.1, min_value=0.0001, format="%.4f")
+        with c2:
+            lam_max = st.number_input("λ до", value=10.0, min_value=0.0001, format="%.4f")
+        with c3:
+            lam_count = st.number_input("Значений λ", value=20, min_value=1, max_value=500)
+        N_text = st.text_input("Значения N через пробел", "100 1000 10000 100000 1000000")
+        independent = st.checkbox("Своя выборка для каждого λ (иначе общая: Δ ∝ 1/λ, 1/λ²)")
+        try:
+            grid_N = tuple(sorted({int(float(v)) for v in N_text.split()}))
+        except ValueError:
+            grid_N = ()
+        draws = max(grid_N, default=0) * (int(lam_count) if independent else 1)
+        if not grid_N or min(grid_N) <= 0 or lam_min > lam_max:
+            st.error("❌ Нужны N > 0 и λ от ≤ λ до")
+        elif draws > sweep.MAX_DRAWS:
+            # Память у sweep блочная, но время растёт как max(N) × число выборок
+            st.error(f"❌ Слишком большая сетка: max(N) × число выборок = {draws:.3g}, "
+                     f"допускается не больше {sweep.MAX_DRAWS:.0e}")
+        else:
+            lams = tuple(np.geomspace(lam_min, lam_max, int(lam_count)))
+            grid = cache.get(("sweep", lams, grid_N, seed, independent),
+                             lambda: sweep.sweep(lams, grid_N, np.random.default_rng(seed),
+                                                 independent))
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+
+            fig = make_subplots(rows=1, cols=2, subplot_titles=("lg Δ1", "lg Δ2"),
+                                horizontal_spacing=0.15)
+            labels = [str(N) for N in grid_N]
+            for col, key in ((1, "delta1"), (2, "delta2")):
+                fig.add_trace(go.Heatmap(
+                    z=np.log10(grid[key]), x=labels, y=[f"{lam:.4g}" for lam in lams],
+                    colorscale="Viridis", colorbar=dict(x=0.43 if col == 1 else 1.0),
+                    hovertemplate="λ=%{y}, N=%{x}<br>lg Δ=%{z:.3f}<extra></extra>"),
+                    row=1, col=col)
+            fig.update_xaxes(title_text="N", type="category")
+            fig.update_yaxes(title_text="λ", type="category")
+            fig.update_layout(height=500, margin=dict(t=40))
+            st.plotly_chart(fig, width="stretch")
+            st.caption(f"Конфигураций: {len(lams) * len(grid_N)}")
+
+    cache_caption(cache)
@@ -0,0 +1,146 @@
+"""
+poisson.py
+Показательные интервалы между событиями и пуассоновский поток для лабораторной 4.
+
+Интервалы генерируются блоками NumPy, моменты времени событий — накопленная
+сумма интервалов с переносом последнего момента в следующий блок, поэтому
+поток из 10^8 событий не хранится целиком. Число событий в окнах длины
+window — длины серий одинаковых номеров окон; от окон остаётся только
+таблица частот (np.bincount: сколько окон содержат k событий), так что
+память — O(chunk_size + max k) при любой длине окна.
+По частотам — среднее, дисперсия и индекс дисперсии D/M числа событий
+(у пуассоновского потока он равен 1).
+
+Пример:
+    python poisson.py --lam 2 --events 1e8 --window 1
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+
+DEFAULT_CHUNK = 1 << 22
+
+
+def arrival_times(lam, n_events, rng=None, chunk_size=DEFAULT_CHUNK):
+    """Блоки (интервалы, моменты событий); моменты продолжают предыдущий блок."""
+    rng = np.random.default_rng() if rng is None else rng
+    t0, done = 0.0, 0
+    while done < n_events:
+        gaps = rng.exponential(1 / lam, min(chunk_size, n_events - done))
+        times = np.cumsum(gaps)
+        times += t0
+        t0 = times[-1]
+        done += len(gaps)
+        yield gaps, times
+
+
+def _add(freq, values, weight=None):
+    # freq[k] += число окон с k событиями (массив растёт по мере надобности)
+    add = np.bincount(values, weights=weight).astype(np.int64)
+    if len(add) > len(freq):
+        freq = np.concatenate((freq, np.zeros(len(add) - len(freq), np.int64)))
+    freq[:len(add)] += add
+    return freq
+
+
+def count_process(lam, n_events, window=1.0, rng=None, chunk_size=DEFAULT_CHUNK, q=20):
+    """Оценки по интервалам (m, Dx) и частоты числа событий в окнах
+    [k·window, (k+1)·window).
+
+    Окно, на котором блок обрывается, переносится в следующий блок; последнее
+    окно потока заполнено не полностью и в статистику не входит.
+    """
+    start = time.perf_counter()
+    freq = np.zeros(0, dtype=np.int64)   # freq[k] — число окон ровно с k событиями
+    carry_idx, carry = -1, 0             # незавершённое окно и события в нём
+    s1 = s2 = 0.0
+    shift = 1 / lam  # сдвиг для устойчивой суммы квадратов
+    first_q = np.empty(0)
+    T = 0.0
+    for gaps, times in arrival_times(lam, n_events, rng, chunk_size):
+        if len(first_q) < q:
+            first_q = np.concatenate((first_q, gaps[:q - len(first_q)]))
+        d = gaps - shift
+        s1 += d.sum()
+        s2 += np.dot(d, d)
+
+        # Номера окон событий не убывают: непустые окна — серии одинаковых номеров.
+        # Длины серий вместо np.bincount по всем окнам блока, чтобы редкие события
+        # в коротких окнах не требовали массива на каждое (пустое) окно
+        idx = (times // window).astype(np.int64)
+        starts = np.flatnonzero(np.diff(idx, prepend=idx[0] - 1))
+        run_idx = idx[starts]
+        run_len = np.diff(starts, append=len(idx))
+        if run_idx[0] == carry_idx:
+            run_len[0] += carry
+        else:
+            if carry_idx >= 0:
+                freq = _add(freq, [carry])
+            if run_idx[0] - carry_idx > 1:   # пустые окна между блоками
+                freq = _add(freq, [0], [run_idx[0] - carry_idx - 1])
+        freq = _add(freq, run_len[:-1])
+        empty = run_idx[-1] - run_idx[0] + 1 - len(run_idx)   # пустые окна внутри блока
+        if empty:
+            freq = _add(freq, [0], [empty])
+        carry_idx, carry = run_idx[-1], int(run_len[-1])
+        T = times[-1]
+
+    k = np.arange(len(freq))
+    windows = freq.sum()
+    mean_count = np.dot(k, freq) / windows if windows else np.nan
+    var_count = np.dot((k - mean_count) ** 2, freq) / windows if windows else np.nan
+    mean_d = s1 / n_events
+    m = shift + mean_d
+    Dx = s2 / n_events - mean_d ** 2
+    return {
+        "lam": lam, "N": n_events, "window": window, "T": T,
+        "first_q": first_q,
+        "Mx": 1 / lam, "m": m, "delta_m": abs(m - 1 / lam),
+        "g": 1 / lam ** 2, "Dx": Dx, "delta_g": abs(Dx - 1 / lam ** 2),
+        "freq": freq, "windows": int(windows),
+        "expected_count": lam * window,
+        "mean_count": mean_count, "var_count": var_count,
+        "dispersion": var_count / mean_count if mean_count > 0 else np.nan,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def poisson_pmf(k, mu):
+    # Через логарифмы: без переполнения при больших k и mu
+    from scipy.special import gammaln
+
+    k = np.asarray(k, dtype=float)
+    return np.exp(k * np.log(mu) - mu - gammaln(k + 1))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Пуассоновский поток: счёт событий по окнам")
+    parser.add_argument("--lam", type=float, default=1.0, help="интенсивность λ")
+    parser.add_argument("--events", default="1e6", help="число событий (допускается 1e8)")
+    parser.add_argument("--window", type=float, default=1.0, help="длина окна")
+    parser.add_argument("--seed", type=int, default=None, help="seed генератора NumPy")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="размер блока")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.lam <= 0 or args.window <= 0:
+        raise SystemExit("❌ λ и длина окна должны быть > 0")
+    res = count_process(args.lam, int(float(args.events)), args.window,
+                        np.random.default_rng(args.seed), args.chunk)
+    print(f"Событий: {res['N']}, время потока T = {res['T']:.1f}, "
+          f"окон: {res['windows']}, расчёт {res['seconds']:.2f} с")
+    print(f"Δ1 = {res['delta_m']:.6f}, Δ2 = {res['delta_g']:.6f}")
+    if res["windows"] == 0:
+        print("⚠️ Ни одно окно не завершилось: уменьшите длину окна или увеличьте число событий")
+        return
+    print(f"Среднее число событий в окне: {res['mean_count']:.4f} (λ·window = {res['expected_count']:.4f})")
+    print(f"Дисперсия: {res['var_count']:.4f}, индекс дисперсии D/M = {res['dispersion']:.4f}")
+
+
+if __name__ == '__main__':
+    main()
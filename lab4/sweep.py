@@ -0,0 +1,72 @@
+"""
+sweep.py
+Перебор сетки (λ, N) для показательного распределения одним векторным расчётом.
+
+X = E / λ, где E ~ Exp(1), поэтому для всех λ достаточно одной выборки E:
+    m(λ, N) = S1(N) / (λ N),  Dx(λ, N) = (S2(N)/N - (S1(N)/N)²) / λ²,
+где S1, S2 — суммы E и E² по первым N значениям. Выборка генерируется блоками
+по chunk_size значений (на все строки λ вместе), так что память — O(chunk_size),
+а не len(lams) × max(N): суммы для значений N сетки внутри блока — np.add.reduceat
+по участкам между соседними N и накопленная сумма участков (как в
+engine.simulate лабораторной 1), а Δ1, Δ2 для всех λ получаются транслированием
+по оси λ.
+
+При общей выборке ошибки для разных λ отличаются только множителями 1/λ и
+1/λ² (общие случайные числа); independent=True даёт каждой строке λ свою
+выборку (времени нужно в len(lams) раз больше).
+"""
+
+import numpy as np
+
+
+DEFAULT_CHUNK = 1 << 22
+# Предел max(N) × число выборок для приложения: 1e9 значений — порядка 10 с
+MAX_DRAWS = 10**9
+
+
+def _prefix_sums(rows, N_sorted, rng, chunk_size):
+    # S1, S2 формы (rows, len(N_sorted)) по блокам выборки E размером ≤ chunk_size
+    S1 = np.empty((rows, len(N_sorted)))
+    S2 = np.empty((rows, len(N_sorted)))
+    acc1, acc2 = np.zeros(rows), np.zeros(rows)
+    block = max(1, chunk_size // rows)
+    done, j = 0, 0
+    while done < N_sorted[-1]:
+        size = int(min(block, N_sorted[-1] - done))
+        E = rng.standard_exponential((rows, size))
+        # Значения N, которые заканчиваются в этом блоке, и участки между ними
+        k = j + np.searchsorted(N_sorted[j:], done + size, side="right")
+        if k > j:
+            ends = N_sorted[j:k] - done
+            starts = np.concatenate(([0], ends[:-1]))
+            part = E[:, :ends[-1]]
+            S1[:, j:k] = acc1[:, None] + np.cumsum(np.add.reduceat(part, starts, axis=1), axis=1)
+            part = part * part
+            S2[:, j:k] = acc2[:, None] + np.cumsum(np.add.reduceat(part, starts, axis=1), axis=1)
+        acc1 += E.sum(axis=1)
+        E *= E
+        acc2 += E.sum(axis=1)
+        done, j = done + size, k
+    return S1, S2
+
+
+def sweep(lams, N_values, rng=None, independent=False, chunk_size=DEFAULT_CHUNK):
+    """Δ1 и Δ2 на сетке: массивы формы (len(lams), len(N_values))."""
+    rng = np.random.default_rng() if rng is None else rng
+    lams = np.asarray(lams, dtype=float)
+    N_values = np.asarray(N_values, dtype=np.int64)
+    if np.any(lams <= 0) or np.any(N_values <= 0):
+        raise ValueError("λ и N должны быть > 0")
+    # Повторы N убираются: у reduceat пустой участок дал бы не ноль
+    N_sorted, inverse = np.unique(N_values, return_inverse=True)
+
+    S1, S2 = _prefix_sums(len(lams) if independent else 1, N_sorted, rng, chunk_size)
+
+    m1 = S1 / N_sorted
+    var1 = S2 / N_sorted - m1 ** 2
+    delta1 = np.abs(m1 - 1) / lams[:, None]
+    delta2 = np.abs(var1 - 1) / lams[:, None] ** 2
+
+    # Обратно к порядку N_values, как их задал пользователь
+    return {"lams": lams, "N": N_values,
+            "delta1": delta1[:, inverse], "delta2": delta2[:, inverse]}
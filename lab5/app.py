@@ -1,7 +1,17 @@
-import random
+import sys
+from pathlib import Path
+
 import numpy as np
 import streamlit as st
 
+# Общие модули приложений lab3–lab5 (кэш выборок, элементы интерфейса)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from widgets import (cache_caption, paged_table, seed_controls, session_store,  # noqa: E402
+                     shared_cache, store_caption)
+
+import normal_engines  # noqa: E402
+import tail  # noqa: E402
+
 # ====== Настройки страницы ======
 st.set_page_config(page_title="Нормальное распределение", layout="centered")
 st.markdown(
@@ -40,20 +50,29 @@ with col2:
 with col3:
     N = st.number_input("", value=100, min_value=1, step=1, placeholder="N")
 
+seed = seed_controls()
+engine = st.selectbox("Способ генерации", list(normal_engines.ENGINES), key="engine")
+cache = shared_cache("lab5")
+
 # ====== Проверка ======
+limit = normal_engines.MAX_N.get(engine)
 if sigma <= 0:
     st.error("❌ σ должно быть > 0")
+elif limit is not None and N > limit:
+    # Цикл на чистом Python: при больших N генерация заняла бы минуты
+    st.error(f"❌ Способ {engine} медленный: N должно быть не больше {limit}")
 else:
-    # ====== Генерация выборки ======
-    samples = [random.normalvariate(mu, sigma) for _ in range(N)]
+    # ====== Выборка сессии: при изменении только N догенерируется хвост ======
+    store = session_store(cache, ("normal", engine, mu, sigma), seed,
+                          lambda rng, n: normal_engines.normal(engine, rng, n, mu, sigma), N)
+    samples = store.take(N)
 
     # Теоретические значения
     Mx = mu
     Dx_theor = sigma ** 2
 
     # Выборочные значения
-    m = sum(samples) / N
-    Dx = sum((x - m) ** 2 for x in samples) / N
+    m, Dx = store.moments(N)
 
     # Δ1, Δ2
     delta_m = abs(m - Mx)
@@ -94,50 +113,49 @@ else:
         )
     st.markdown("---")
 
-    # ====== Таблица первых 20 значений ======
-    first_20 = samples[:20]
-    rows = (len(first_20) + 4) // 5  # число строк
-
-    first_20_arr = np.array(first_20 + [None] * (rows * 5 - len(first_20))).reshape(rows, 5)
-    first_20_str = [[("" if v is None else f"{v:.6f}") for v in row] for row in first_20_arr]
-
-    table_html = """
-    <style>
-    table {
-        border-collapse: collapse;
-        width: 100%;
-        font-size: 14px;
-    }
-    th {
-        background-color: #4C78A8;
-        color: white;
-        padding: 8px;
-        text-align: center;
-        border: 1px solid #ddd;
-    }
-    td {
-        padding: 8px;
-        border: 1px solid #ddd;
-        text-align: center;
-    }
-    tr:nth-child(even) {
-        background-color: #f2f2f2;
-    }
-    </style>
-    <h3 style="color:#4C78A8;">📋 Первые 20 значений</h3>
-    <table>
-        <tr>
-    """
-
-    # Заголовки столбцов
-    for j in range(5):
-        table_html += f"<th>Колонка {j+1}</th>"
-    table_html += "</tr>"
-
-    # Данные
-    for row in first_20_str:
-        table_html += "<tr>" + "".join(f"<td>{val}</td>" for val in row) + "</tr>"
-
-    table_html += "</table>"
-
-    st.markdown(table_html, unsafe_allow_html=True)
\ No newline at end of file
+    # ====== Вероятность хвоста P(X > k): выборка по значимости ======
+    if st.checkbox("📉 Вероятность хвоста P(X > k)"):
+        c1, c2 = st.columns(2)
+        with c1:
+            k = st.number_input("k", value=mu + 5 * sigma, format="%.4f")
+        with c2:
+            n_is = st.number_input("N для оценки по значимости", value=10**5, min_value=100,
+                                   max_value=10**8, step=10**5)
+        est = cache.get(("tail", mu, sigma, k, n_is, seed),
+                        lambda: tail.tail_study(k, n_is, mu, sigma, np.random.default_rng(seed)))
+        naive_p, naive_rel = tail.naive_tail(samples, k)
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Точно", f"{est['exact']:.4e}", f"k = μ + {(k - mu) / sigma:.2f}σ",
+                  delta_color="off")
+        c2.metric("По значимости", f"{est['p']:.4e}",
+                  f"отн. ошибка {est['rel_error']:.2%}", delta_color="off")
+        c3.metric(f"Доля в выборке (N = {N})", f"{naive_p:.4e}",
+                  f"отн. ошибка {naive_rel:.2%}" if naive_p > 0 else "нет попаданий",
+                  delta_color="off")
+        st.caption(f"Сдвиг предложения θ = {est['theta']:.3f}, попаданий {est['hits']} из {n_is}. "
+                   f"Обычной выборке для той же относительной ошибки нужно "
+                   f"N ≈ {est['naive_n']:.3g} — в {est['saving']:.3g} раз больше.")
+        st.markdown("---")
+
+    # ====== Таблица: только видимая страница хранимой выборки ======
+    paged_table(samples)
+    store_caption(store, N)
+
+    # ====== Сравнение способов генерации: скорость и точность ======
+    st.markdown("---")
+    if st.checkbox("⚡ Сравнение способов генерации на текущем N"):
+        rows = cache.get(("compare", N, seed),
+                         lambda: normal_engines.compare(N, np.random.default_rng(seed)))
+        st.dataframe(
+            [{"Способ": r["engine"], "N": r["N"], "Время, с": r["seconds"],
+              "Знач./с": r["samples_per_sec"], "Среднее": r["mean"], "Дисперсия": r["var"],
+              "Эксцесс": r["excess"], "D (Колмогоров)": r["ks_stat"], "p-value": r["ks_pvalue"]}
+             for r in rows],
+            hide_index=True)
+        fastest = max(rows, key=lambda r: r["samples_per_sec"])
+        st.caption(f"Быстрее всего: {fastest['engine']}. Критерий Колмогорова — по первым "
+                   f"{min(N, 10**6)} значениям; normalvariate ограничен "
+                   f"{normal_engines.MAX_N['normalvariate']} значениями.")
+
+    cache_caption(cache)
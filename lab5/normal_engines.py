@@ -0,0 +1,115 @@
+"""
+normal_engines.py
+Способы генерации стандартных нормальных величин для лабораторной 5.
+Каждый способ — функция engine(rng, n), возвращающая n значений N(0, 1):
+
+    ziggurat     — rng.standard_normal (в NumPy реализован метод зиккурата);
+    box_muller   — преобразование Бокса–Мюллера, векторно, по паре на два
+                   равномерных числа (как в lab6/lab6.html, но без цикла);
+    polar        — полярный метод Марсальи: без sin/cos, доля принятых
+                   точек π/4, недостающие точки догенерируются блоком;
+    ndtri        — метод обратной функции: scipy.special.ndtri(U), U из интервала (0, 1);
+    normalvariate — исходный цикл random.normalvariate (для сравнения).
+
+compare() замеряет скорость и точность (моменты, критерий Колмогорова) всех
+способов на одном N.
+"""
+
+import random
+import time
+
+import numpy as np
+
+
+def ziggurat(rng, n):
+    return rng.standard_normal(n)
+
+
+def box_muller(rng, n):
+    half = (n + 1) // 2
+    u1 = 1.0 - rng.random(half)   # (0, 1]: log(0) не возникает
+    u2 = rng.random(half)
+    r = np.sqrt(-2.0 * np.log(u1))
+    theta = 2.0 * np.pi * u2
+    return np.concatenate((r * np.cos(theta), r * np.sin(theta)))[:n]
+
+
+def polar(rng, n):
+    out = np.empty(n)
+    have = 0
+    while have < n:
+        # Пар с запасом на отказы: принимается π/4 ≈ 0.785 точек
+        size = int((n - have) / 2 / 0.785 * 1.05) + 8
+        v = 2.0 * rng.random((2, size)) - 1.0
+        s = v[0] ** 2 + v[1] ** 2
+        keep = (s > 0) & (s < 1)
+        v, s = v[:, keep], s[keep]
+        f = np.sqrt(-2.0 * np.log(s) / s)
+        z = np.concatenate((v[0] * f, v[1] * f))[:n - have]
+        out[have:have + len(z)] = z
+        have += len(z)
+    return out
+
+
+def ndtri(rng, n):
+    from scipy.special import ndtri as _ndtri
+
+    # U строго внутри (0, 1): середины 2^52 равных отрезков, от 2^-53 до 1 - 2^-53
+    # (при 2^53 отрезках верхняя середина округлилась бы до 1.0, а ndtri(1) = +inf)
+    u = (rng.integers(0, 2**52, n) + 0.5) / 2**52
+    return _ndtri(u)
+
+
+def normalvariate(rng, n):
+    gen = random.Random(int(rng.integers(2**63)))
+    return np.array([gen.normalvariate(0.0, 1.0) for _ in range(n)])
+
+
+ENGINES = {
+    "ziggurat": ziggurat,
+    "box_muller": box_muller,
+    "polar": polar,
+    "ndtri": ndtri,
+    "normalvariate": normalvariate,
+}
+
+# Цикл на чистом Python при больших N занимает минуты — в сравнении ограничиваем
+MAX_N = {"normalvariate": 10**6}
+
+
+def normal(engine, rng, n, mu=0.0, sigma=1.0):
+    try:
+        z = ENGINES[engine](rng, n)
+    except KeyError:
+        raise ValueError(f"Неизвестный способ '{engine}'. Доступны: {', '.join(ENGINES)}") from None
+    return mu + sigma * z
+
+
+def compare(n, rng=None, engines=None, ks_max=10**6):
+    """Скорость и точность способов: строки с временем, значений в секунду,
+    выборочными средним, дисперсией, эксцессом и статистикой Колмогорова.
+
+    Критерий считается по первым ks_max значениям (сортировка всей выборки
+    при N = 10^8 заняла бы больше времени, чем сама генерация).
+    """
+    from scipy import stats
+
+    rng = np.random.default_rng() if rng is None else rng
+    rows = []
+    for name in engines or ENGINES:
+        size = min(n, MAX_N.get(name, n))
+        start = time.perf_counter()
+        z = ENGINES[name](rng, size)
+        elapsed = time.perf_counter() - start
+        m = z.mean()
+        d = z - m
+        var = np.dot(d, d) / size
+        ks = stats.kstest(z[:ks_max], "norm")
+        rows.append({
+            "engine": name, "N": size, "seconds": elapsed,
+            "samples_per_sec": size / elapsed if elapsed > 0 else float("inf"),
+            "mean": float(m), "var": float(var),
+            "excess": float(np.dot(d * d, d * d) / size / var ** 2 - 3) if var > 0 else np.nan,
+            "ks_stat": float(ks.statistic), "ks_pvalue": float(ks.pvalue),
+        })
+    return rows
@@ -0,0 +1,64 @@
+"""
+tail.py
+Оценка вероятности хвоста P(X > k) нормальной СВ выборкой по значимости.
+
+Обычная оценка — доля значений больше k; её относительная ошибка
+sqrt((1 - p) / (N p)), и при p ~ 1e-9 нужны N ~ 1e11 и больше.
+Здесь значения берутся из сдвинутого распределения N(θ, 1) для
+t = (k - μ) / σ (по умолчанию θ = max(t, 0): половина точек попадает в хвост;
+при k ≤ μ это не хвост, и сдвиг не нужен),
+а каждое попадание взвешивается отношением правдоподобия
+    w(z) = φ(z) / φ(z - θ) = exp(-θ z + θ² / 2).
+Оценка p = среднее 1{z > t} · w(z) несмещённая, её относительная ошибка
+на много порядков меньше, чем у обычной оценки при том же N.
+"""
+
+import math
+
+import numpy as np
+
+
+def exact_tail(k, mu=0.0, sigma=1.0):
+    return 0.5 * math.erfc((k - mu) / sigma / math.sqrt(2))
+
+
+def naive_tail(samples, k):
+    """Доля значений больше k и её относительная ошибка (inf, если попаданий нет)."""
+    n = len(samples)
+    p = np.count_nonzero(np.asarray(samples) > k) / n
+    rel = math.sqrt((1 - p) / (n * p)) if p > 0 else math.inf
+    return p, rel
+
+
+def importance_tail(k, n, mu=0.0, sigma=1.0, rng=None, theta=None):
+    """Оценка P(X > k) по n значениям из N(θ, 1) в стандартизованной шкале."""
+    rng = np.random.default_rng() if rng is None else rng
+    t = (k - mu) / sigma
+    theta = max(t, 0.0) if theta is None else theta
+    z = theta + rng.standard_normal(n)
+    hit = z > t
+    w = np.exp(-theta * z[hit] + theta ** 2 / 2)
+    p = w.sum() / n
+    # Дисперсия слагаемых 1{z > t}·w: E[w²; z > t] - p²
+    var = max(np.dot(w, w) / n - p ** 2, 0.0)
+    rel = math.sqrt(var / n) / p if p > 0 else math.inf
+    return {"p": p, "rel_error": rel, "n": n, "theta": theta, "hits": int(hit.sum())}
+
+
+def naive_n_for(p, rel_error):
+    """Объём обычной выборки, при котором её относительная ошибка равна rel_error."""
+    return (1 - p) / (p * rel_error ** 2)
+
+
+def tail_study(k, n, mu=0.0, sigma=1.0, rng=None):
+    """Оценка по значимости, точное значение и выигрыш в объёме выборки.
+
+    Доля попаданий в обычной выборке для сравнения — naive_tail.
+    """
+    res = importance_tail(k, n, mu, sigma, rng)
+    p_exact = exact_tail(k, mu, sigma)
+    res.update(exact=p_exact, abs_rel_deviation=abs(res["p"] / p_exact - 1) if p_exact else math.nan)
+    ok = p_exact > 0 and 0 < res["rel_error"] < math.inf
+    res["naive_n"] = naive_n_for(p_exact, res["rel_error"]) if ok else math.inf
+    res["saving"] = res["naive_n"] / n
+    return res